@@ -254,6 +254,14 @@ class AgentOrchestrator:
 
             raise
 
+        finally:
+            # Persist this round's MCP access logs together; a failed write is
+            # re-queued by the registry and must not mask the real outcome
+            try:
+                await self.mcp_registry.flush_trace(trace_id)
+            except Exception as e:
+                logger.error("mcp_access_flush_failed", trace_id=str(trace_id), error=str(e))
+
     async def execute_campaign(
         self,
         campaign_id: UUID,
@@ -395,6 +403,14 @@ class AgentOrchestrator:
 
             raise
 
+        finally:
+            # Persist the campaign-level MCP access logs together; a failed write is
+            # re-queued by the registry and must not mask the real outcome
+            try:
+                await self.mcp_registry.flush_trace(trace_id)
+            except Exception as e:
+                logger.error("mcp_access_flush_failed", trace_id=str(trace_id), error=str(e))
+
     async def _create_initial_variants(self, context: AgentContext) -> List[UUID]:
         """Create initial variant(s) for round 1."""
         from evo_ai.domain.models.variant import Variant
@@ -1,5 +1,6 @@
 """FastAPI application factory."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import AsyncGenerator
@@ -21,7 +22,10 @@ from evo_ai.api.routers import (
 from evo_ai.api.schemas import HealthResponse, ErrorResponse
 from evo_ai.infrastructure.observability.tracing import setup_tracing
 from evo_ai.infrastructure.observability.logging import setup_logging
+from evo_ai.mcp.registry import mcp_registry
 from evo_ai.tasks import init_ray, shutdown_ray
+from evo_ai.tasks.campaign_tasks import shutdown_local_executor
+from evo_ai.tasks.job_tracker import job_tracker
 from evo_ai.tasks.ray_config import get_cluster_info
 
 logger = structlog.get_logger(__name__)
@@ -52,6 +56,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     #     logger.warning("ray_initialization_failed_continuing_without_ray", error=str(e))
     print("Ray disabled for local testing")
 
+    # Expire finished jobs with per-job timers on the API loop
+    job_tracker.attach_loop(asyncio.get_running_loop())
+
+    # Write aged MCP access logs even when no further calls arrive
+    mcp_registry.start_periodic_flush()
+
     print(f"API started - version {app.version}")
 
     yield
@@ -67,6 +77,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     #     logger.warning("ray_shutdown_failed", error=str(e))
 
     # Cleanup (close database connections, etc.)
+    # Drops queued local jobs; running ones still finish before the process exits
+    shutdown_local_executor()
+    job_tracker.attach_loop(None)
+    await mcp_registry.stop_periodic_flush()
+    await mcp_registry.flush_access_logs()
 
     print("API shutdown complete")
 
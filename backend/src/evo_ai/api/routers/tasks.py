@@ -3,7 +3,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 
 import structlog
@@ -11,10 +11,10 @@ import structlog
 from evo_ai.tasks import (
     execute_round_task,
     execute_campaign_task,
-    job_tracker,
     JobStatus,
 )
-from evo_ai.tasks.campaign_tasks import get_task_status, cancel_task
+from evo_ai.tasks.campaign_tasks import cancel_task
+from evo_ai.tasks.job_tracker import job_tracker
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -165,7 +165,7 @@ async def execute_campaign_async(
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: UUID) -> JobResponse:
+async def get_job_status(job_id: UUID) -> Response:
     """
     Get job status by ID.
 
@@ -198,12 +198,13 @@ async def get_job_status(job_id: UUID) -> JobResponse:
             "duration_seconds": 295.0
         }
     """
-    status = get_task_status(job_id)
+    job = job_tracker.get_job(job_id)
 
-    if not status:
+    if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return JobResponse(**status)
+    # Pre-encoded JSON; the result payload is embedded without re-encoding
+    return Response(content=job.to_json(), media_type="application/json")
 
 
 @router.get("", response_model=List[JobResponse])
@@ -211,7 +212,7 @@ async def list_jobs(
     campaign_id: Optional[UUID] = None,
     status: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000)
-) -> List[JobResponse]:
+) -> Response:
     """
     List jobs with optional filters.
 
@@ -233,23 +234,8 @@ async def list_jobs(
     # Limit results
     jobs = jobs[:limit]
 
-    return [
-        JobResponse(
-            job_id=str(job.job_id),
-            task_type=job.task_type,
-            status=job.status.value,
-            campaign_id=str(job.campaign_id) if job.campaign_id else None,
-            round_number=job.round_number,
-            progress=job.progress,
-            result=job.result,
-            error=job.error,
-            created_at=job.created_at.isoformat(),
-            started_at=job.started_at.isoformat() if job.started_at else None,
-            completed_at=job.completed_at.isoformat() if job.completed_at else None,
-            duration_seconds=job.duration_seconds
-        )
-        for job in jobs
-    ]
+    content = b"[" + b",".join(job.to_json() for job in jobs) + b"]"
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/{job_id}/cancel", response_model=dict)
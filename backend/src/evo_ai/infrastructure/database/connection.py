@@ -1,9 +1,10 @@
 """Database connection management."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 from urllib.parse import urlparse, parse_qs, urlunparse
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
@@ -64,6 +65,11 @@ def prepare_database_url(url: str) -> tuple[str, dict]:
     return clean_url, connect_args
 
 
+def json_dumps(value: Any) -> str:
+    """Serialize a value for JSON columns using orjson."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Prepare database URL and connection arguments
 database_url, connect_args = prepare_database_url(settings.database_url)
 
@@ -75,6 +81,8 @@ engine = create_async_engine(
     max_overflow=settings.database_max_overflow,
     pool_pre_ping=True,  # Verify connections before using
     connect_args=connect_args,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
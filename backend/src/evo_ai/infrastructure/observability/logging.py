@@ -1,5 +1,6 @@
 """Structured JSON logging with trace context."""
 
+import logging
 import sys
 
 import structlog
@@ -7,6 +8,9 @@ from opentelemetry import trace
 
 from evo_ai.config import settings
 
+# Minimum level emitted by the configured logger (NOTSET until setup_logging runs)
+_min_level = logging.NOTSET
+
 
 def add_trace_context(
     logger: structlog.BoundLogger,
@@ -80,11 +84,12 @@ def setup_logging() -> None:
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
+    global _min_level
+    _min_level = getattr(logging, settings.log_level.upper())
+
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(structlog.stdlib.logging, settings.log_level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_min_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
         cache_logger_on_first_use=True,
@@ -107,3 +112,17 @@ def get_logger(name: str) -> structlog.BoundLogger:
         logger.error("processing_failed", campaign_id=campaign_id, error=str(e))
     """
     return structlog.get_logger(name)
+
+
+def is_enabled_for(level: int) -> bool:
+    """
+    Check whether a log level will be emitted.
+
+    Use this to skip building expensive log fields on hot paths; the
+    filtering logger drops the call itself, but not its argument evaluation.
+
+    Example:
+        if is_enabled_for(logging.INFO):
+            logger.info("tool_completed", payload=summarize(result))
+    """
+    return level >= _min_level
@@ -9,7 +9,7 @@ from evo_ai.infrastructure.observability.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPServerMetadata:
     """Metadata describing an MCP server."""
 
@@ -1,19 +1,69 @@
 """MCP server registry with versioning and access logging."""
 
+import asyncio
+import logging
+import threading
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import orjson
 from semver import Version
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from evo_ai.infrastructure.database.connection import get_session
+from evo_ai.infrastructure.database.connection import get_session, json_dumps
 from evo_ai.infrastructure.database.models import MCPAccessLogDB
-from evo_ai.infrastructure.observability.logging import get_logger
+from evo_ai.infrastructure.observability.logging import get_logger, is_enabled_for
 from evo_ai.infrastructure.observability.metrics import mcp_calls, mcp_duration
 from evo_ai.mcp.base_server import BaseMCPServer, MCPServerMetadata
 
 logger = get_logger(__name__)
 
+# Tool outputs larger than this (serialized) are not stored in access logs
+MAX_OUTPUT_BYTES = 64 * 1024
+
+# Buffered access-log rows are flushed once this many are pending...
+ACCESS_LOG_BATCH_SIZE = 100
+
+# ...or once the oldest pending row is this many seconds old
+ACCESS_LOG_MAX_AGE_SECONDS = 5.0
+
+# Rows from failed writes are re-queued unless the buffer already holds this many
+MAX_PENDING_ACCESS_LOGS = 10_000
+
+# After a failed write, batch-size and age flushes wait this long before retrying
+ACCESS_LOG_RETRY_SECONDS = 30.0
+
+# Access-log batches at or above this size are written with COPY instead of INSERT
+COPY_THRESHOLD = 500
+
+_ACCESS_LOG_COLUMNS = (
+    "id",
+    "trace_id",
+    "mcp_server_name",
+    "mcp_server_version",
+    "tool_name",
+    "input_params",
+    "output_data",
+    "status",
+    "error_message",
+    "duration_ms",
+    "created_at",
+)
+
+
+@lru_cache(maxsize=1024)
+def _calls_metric(server_name: str, tool_name: str, status: str) -> Any:
+    """Return the cached mcp_calls child for a label set."""
+    return mcp_calls.labels(server_name=server_name, tool_name=tool_name, status=status)
+
+
+@lru_cache(maxsize=1024)
+def _duration_metric(server_name: str, tool_name: str) -> Any:
+    """Return the cached mcp_duration child for a label set."""
+    return mcp_duration.labels(server_name=server_name, tool_name=tool_name)
+
 
 class MCPRegistry:
     """
@@ -27,11 +77,25 @@ class MCPRegistry:
     - Error handling and retries
 
     NON-NEGOTIABLE: All MCP access must be versioned and logged.
+
+    Access-log rows are buffered per trace_id and written one trace per
+    transaction. Callers that own a trace (round/campaign runners) must call
+    flush_trace() when it ends; everything else is flushed by batch size or
+    age (see start_periodic_flush()), or by flush_access_logs() on shutdown.
+    Rows from a failed write are re-queued and retried on the next flush.
     """
 
     def __init__(self) -> None:
         """Initialize MCP registry."""
         self._servers: Dict[str, BaseMCPServer] = {}
+        self._pending_logs: Dict[Optional[UUID], List[MCPAccessLogDB]] = {}
+        self._pending_count = 0
+        self._oldest_pending: Optional[float] = None
+        # Monotonic time before which size/age flushes are skipped (set on failure)
+        self._next_flush_after = 0.0
+        # Task runners on different threads share the global registry
+        self._pending_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task[None]] = None
         logger.info("mcp_registry_initialized")
 
     def register(self, server: BaseMCPServer) -> None:
@@ -64,6 +128,19 @@ class MCPRegistry:
             tools=metadata.available_tools
         )
 
+    def reset(self) -> None:
+        """
+        Drop all registered servers and discard buffered access-log rows.
+
+        Lets tests reuse one registry instead of building a new one per test.
+        """
+        with self._pending_lock:
+            self._pending_logs = {}
+            self._pending_count = 0
+            self._oldest_pending = None
+            self._next_flush_after = 0.0
+        self._servers.clear()
+
     def get_server(
         self,
         name: str,
@@ -158,6 +235,7 @@ class MCPRegistry:
             )
         """
         start_time = time.time()
+        trace_str = str(trace_id) if trace_id else None
         status = "error"
         output_data = None
         error_message = None
@@ -184,31 +262,30 @@ class MCPRegistry:
             tool = tools[tool_name]
 
             # Execute tool
-            logger.info(
-                "mcp_tool_executing",
-                server=server_name,
-                version=metadata.version,
-                tool=tool_name,
-                trace_id=str(trace_id) if trace_id else None,
-            )
+            log_info = is_enabled_for(logging.INFO)
+            if log_info:
+                logger.info(
+                    "mcp_tool_executing",
+                    server=server_name,
+                    version=metadata.version,
+                    tool=tool_name,
+                    trace_id=trace_str,
+                )
 
             output_data = await tool(**params) if hasattr(tool, '__await__') else tool(**params)
             status = "success"
 
             # Update metrics
-            mcp_calls.labels(
-                server_name=server_name,
-                tool_name=tool_name,
-                status="success"
-            ).inc()
-
-            logger.info(
-                "mcp_tool_completed",
-                server=server_name,
-                tool=tool_name,
-                duration_ms=int((time.time() - start_time) * 1000),
-                trace_id=str(trace_id) if trace_id else None,
-            )
+            _calls_metric(server_name, tool_name, "success").inc()
+
+            if log_info:
+                logger.info(
+                    "mcp_tool_completed",
+                    server=server_name,
+                    tool=tool_name,
+                    duration_ms=int((time.time() - start_time) * 1000),
+                    trace_id=trace_str,
+                )
 
             return output_data
 
@@ -217,18 +294,14 @@ class MCPRegistry:
             status = "error"
 
             # Update metrics
-            mcp_calls.labels(
-                server_name=server_name,
-                tool_name=tool_name,
-                status="error"
-            ).inc()
+            _calls_metric(server_name, tool_name, "error").inc()
 
             logger.error(
                 "mcp_tool_failed",
                 server=server_name,
                 tool=tool_name,
                 error=error_message,
-                trace_id=str(trace_id) if trace_id else None,
+                trace_id=trace_str,
             )
             raise
 
@@ -236,10 +309,7 @@ class MCPRegistry:
             duration_ms = int((time.time() - start_time) * 1000)
 
             # Update duration metric
-            mcp_duration.labels(
-                server_name=server_name,
-                tool_name=tool_name
-            ).observe(duration_ms / 1000.0)
+            _duration_metric(server_name, tool_name).observe(duration_ms / 1000.0)
 
             # Log to database (NON-NEGOTIABLE)
             await self._log_access(
@@ -267,33 +337,247 @@ class MCPRegistry:
         duration_ms: int,
     ) -> None:
         """
-        Log MCP access to database.
+        Queue an MCP access-log row for the database.
 
-        This is a non-negotiable requirement from AGENTS.md.
+        Rows are buffered per trace_id; see flush_trace(). This is a non-negotiable requirement from AGENTS.md.
         """
-        async with get_session() as session:
-            log_entry = MCPAccessLogDB(
-                trace_id=trace_id,
-                mcp_server_name=server_name,
-                mcp_server_version=server_version,
-                tool_name=tool_name,
-                input_params=input_params,
-                output_data=output_data if status == "success" else None,
-                status=status,
-                error_message=error_message,
-                duration_ms=duration_ms,
+        logged_output = output_data if status == "success" else None
+        if logged_output is not None:
+            # Encode once: the Fragment is embedded verbatim by json_dumps when
+            # the row is written (engine json_serializer and the COPY path)
+            encoded = json_dumps(logged_output)
+            if len(encoded) > MAX_OUTPUT_BYTES:
+                logged_output = {"truncated": True, "size_bytes": len(encoded)}
+            else:
+                logged_output = orjson.Fragment(encoded)
+
+        log_entry = MCPAccessLogDB(
+            trace_id=trace_id,
+            mcp_server_name=server_name,
+            mcp_server_version=server_version,
+            tool_name=tool_name,
+            input_params=input_params,
+            output_data=logged_output,
+            status=status,
+            error_message=error_message,
+            duration_ms=duration_ms,
+        )
+        now = time.monotonic()
+        with self._pending_lock:
+            self._pending_logs.setdefault(trace_id, []).append(log_entry)
+            self._pending_count += 1
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            should_flush = now >= self._next_flush_after and (
+                self._pending_count >= ACCESS_LOG_BATCH_SIZE
+                or now - self._oldest_pending >= ACCESS_LOG_MAX_AGE_SECONDS
             )
-            session.add(log_entry)
-            await session.commit()
 
+        if is_enabled_for(logging.DEBUG):
             logger.debug(
-                "mcp_access_logged",
+                "mcp_access_queued",
                 server=server_name,
                 tool=tool_name,
                 status=status,
                 trace_id=str(trace_id) if trace_id else None,
             )
 
+        # Failed writes are logged and re-queued, never raised into call_tool,
+        # and back off further inline flushes so an outage doesn't add a
+        # failing round trip to every call
+        if should_flush:
+            await self.flush_access_logs()
+
+    async def flush_trace(self, trace_id: Optional[UUID]) -> int:
+        """
+        Write all buffered access-log rows for one trace in a single transaction.
+
+        Called by round/campaign runners when their trace completes so that all
+        rows for it are durable together. If the write fails the rows are
+        re-queued and the error is re-raised.
+
+        Args:
+            trace_id: Trace whose rows should be flushed
+
+        Returns:
+            Number of rows written
+        """
+        with self._pending_lock:
+            entries = self._pending_logs.pop(trace_id, [])
+            self._pending_count -= len(entries)
+            if not self._pending_logs:
+                self._oldest_pending = None
+
+        try:
+            await self._write_access_logs(entries)
+        except Exception:
+            self._requeue(trace_id, entries)
+            raise
+        return len(entries)
+
+    async def flush_access_logs(self) -> int:
+        """
+        Write all buffered access-log rows, one transaction per trace.
+
+        A trace whose write fails is logged and re-queued; the remaining
+        traces are still written, and no error is raised.
+
+        Returns:
+            Number of rows written
+        """
+        with self._pending_lock:
+            pending = self._pending_logs
+            self._pending_logs = {}
+            self._pending_count = 0
+            self._oldest_pending = None
+
+        written = 0
+        failed = False
+        for trace_id, entries in pending.items():
+            try:
+                await self._write_access_logs(entries)
+            except Exception as e:
+                logger.error(
+                    "mcp_access_flush_failed",
+                    trace_id=str(trace_id) if trace_id else None,
+                    count=len(entries),
+                    error=str(e),
+                )
+                self._requeue(trace_id, entries)
+                failed = True
+            else:
+                written += len(entries)
+
+        if not failed:
+            with self._pending_lock:
+                self._next_flush_after = 0.0
+        return written
+
+    def _requeue(self, trace_id: Optional[UUID], entries: List[MCPAccessLogDB]) -> None:
+        """
+        Put rows from a failed write back ahead of the trace's newer rows.
+
+        Size and age flushes are then held off for ACCESS_LOG_RETRY_SECONDS.
+        """
+        if not entries:
+            return
+
+        with self._pending_lock:
+            self._next_flush_after = time.monotonic() + ACCESS_LOG_RETRY_SECONDS
+            if self._pending_count + len(entries) > MAX_PENDING_ACCESS_LOGS:
+                dropped = True
+            else:
+                dropped = False
+                self._pending_logs[trace_id] = entries + self._pending_logs.get(trace_id, [])
+                self._pending_count += len(entries)
+                if self._oldest_pending is None:
+                    self._oldest_pending = time.monotonic()
+
+        if dropped:
+            logger.error(
+                "mcp_access_logs_dropped",
+                trace_id=str(trace_id) if trace_id else None,
+                count=len(entries),
+                pending=self._pending_count,
+            )
+
+    def start_periodic_flush(self, interval: float = ACCESS_LOG_MAX_AGE_SECONDS) -> None:
+        """
+        Flush aged rows from a background task on the running loop.
+
+        Without it, rows older than ACCESS_LOG_MAX_AGE_SECONDS are only
+        written when the next call is logged.
+
+        Args:
+            interval: Seconds between checks
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._periodic_flush(interval)
+            )
+
+    async def stop_periodic_flush(self) -> None:
+        """Cancel the background flush task started by start_periodic_flush()."""
+        task, self._flush_task = self._flush_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _periodic_flush(self, interval: float) -> None:
+        """
+        Flush all buffered rows whenever the oldest has reached the max age,
+        honouring the retry backoff after a failed write.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            with self._pending_lock:
+                due = (
+                    self._oldest_pending is not None
+                    and now >= self._next_flush_after
+                    and now - self._oldest_pending >= ACCESS_LOG_MAX_AGE_SECONDS
+                )
+            if due:
+                await self.flush_access_logs()
+
+    async def _write_access_logs(self, entries: List[MCPAccessLogDB]) -> None:
+        """
+        Persist a batch of access-log rows in one transaction.
+
+        Small batches go through the ORM; batches of COPY_THRESHOLD rows or
+        more are streamed with PostgreSQL COPY, which skips per-row
+        parse/plan work.
+        """
+        if not entries:
+            return
+
+        async with get_session() as session:
+            if len(entries) >= COPY_THRESHOLD:
+                await self._copy_access_logs(session, entries)
+            else:
+                session.add_all(entries)
+
+        logger.debug("mcp_access_logged", count=len(entries))
+
+    @staticmethod
+    async def _copy_access_logs(
+        session: AsyncSession,
+        entries: List[MCPAccessLogDB],
+    ) -> None:
+        """Bulk-load access-log rows via asyncpg's COPY support."""
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None, "session connection is closed"
+
+        records = [
+            (
+                entry.id,
+                entry.trace_id,
+                entry.mcp_server_name,
+                entry.mcp_server_version,
+                entry.tool_name,
+                json_dumps(entry.input_params),
+                json_dumps(entry.output_data) if entry.output_data is not None else None,
+                entry.status,
+                entry.error_message,
+                entry.duration_ms,
+                entry.created_at,
+            )
+            for entry in entries
+        ]
+
+        await driver_connection.copy_records_to_table(
+            MCPAccessLogDB.__tablename__,
+            records=records,
+            columns=_ACCESS_LOG_COLUMNS,
+            schema_name="public",
+        )
+
 
 # Global registry instance
 mcp_registry = MCPRegistry()
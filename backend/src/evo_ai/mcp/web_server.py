@@ -1,5 +1,6 @@
 """Web MCP server for HTTP requests and web scraping."""
 
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -9,6 +10,12 @@ from bs4 import BeautifulSoup
 from evo_ai.mcp.base_server import BaseMCPServer, MCPServerMetadata
 
 
+@lru_cache(maxsize=8192)
+def _absolute_url(base: str, href: str) -> str:
+    """Resolve href against base, memoized (pages repeat the same hrefs)."""
+    return urljoin(base, href)
+
+
 class WebMCPServer(BaseMCPServer):
     """
     Web MCP server for HTTP requests and web scraping.
@@ -230,19 +237,15 @@ class WebMCPServer(BaseMCPServer):
         soup = BeautifulSoup(response.text, 'html.parser')
 
         base = base_url or str(response.url)
-        links = []
-
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(base, href)
 
-            links.append({
+        return [
+            {
                 "text": link.get_text(strip=True),
-                "href": absolute_url,
-                "relative": href,
-            })
-
-        return links
+                "href": _absolute_url(base, link['href']),
+                "relative": link['href'],
+            }
+            for link in soup.find_all('a', href=True)
+        ]
 
     async def close(self) -> None:
         """Close HTTP client."""
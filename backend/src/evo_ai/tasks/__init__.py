@@ -1,17 +1,19 @@
 """Ray task orchestration for distributed execution."""
 
-from evo_ai.tasks.ray_config import init_ray, shutdown_ray
+from evo_ai.tasks.ray_config import init_ray, shutdown_ray, is_ray_initialized
 from evo_ai.tasks.campaign_tasks import (
     execute_round_task,
     execute_campaign_task,
 )
-from evo_ai.tasks.job_tracker import JobTracker, JobStatus
+from evo_ai.tasks.job_tracker import JobTracker, JobStatus, RedisJobTracker
 
 __all__ = [
     "init_ray",
     "shutdown_ray",
+    "is_ray_initialized",
     "execute_round_task",
     "execute_campaign_task",
     "JobTracker",
     "JobStatus",
+    "RedisJobTracker",
 ]
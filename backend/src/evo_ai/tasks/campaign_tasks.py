@@ -1,8 +1,10 @@
 """Ray tasks for campaign and round execution."""
 
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 from uuid import UUID, uuid4
 import asyncio
+import atexit
 import os
 import threading
 
@@ -11,17 +13,76 @@ import structlog
 
 from evo_ai.agents.implementations.orchestrator import AgentOrchestrator
 from evo_ai.mcp.registry import mcp_registry
-from evo_ai.tasks.job_tracker import job_tracker, JobStatus
+from evo_ai.tasks.job_tracker import job_tracker, JobStatus, TERMINAL_STATUSES
 
 logger = structlog.get_logger(__name__)
 
+# Per-thread state for local (non-Ray) execution
+_thread_state = threading.local()
 
-def _use_ray() -> bool:
-    """Return True when Ray should be used for execution."""
+# Bounded worker pool for local execution when no event loop is running,
+# created on first use and again after a shutdown
+_local_executor: Optional[ThreadPoolExecutor] = None
+_local_executor_lock = threading.Lock()
+
+# Futures for jobs queued on the local pool, keyed by job ID
+_local_futures: Dict[UUID, "Future[None]"] = {}
+
+
+def _get_local_executor() -> ThreadPoolExecutor:
+    """Return the local worker pool, creating it if needed."""
+    global _local_executor
+    with _local_executor_lock:
+        if _local_executor is None:
+            _local_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("EVO_AI_LOCAL_WORKERS", "8")),
+                thread_name_prefix="evo-local",
+            )
+        return _local_executor
+
+
+def shutdown_local_executor() -> None:
+    """
+    Stop the local worker pool, cancelling jobs that have not started.
+
+    Queued jobs are marked CANCELLED. Jobs already running are not
+    interrupted: pool workers are non-daemon threads, so the interpreter
+    still waits for them to finish at exit, and their per-thread event
+    loops are released with the threads. Called from the API lifespan and
+    at exit; safe to call more than once.
+    """
+    global _local_executor
+    with _local_executor_lock:
+        executor, _local_executor = _local_executor, None
+    if executor is None:
+        return
+
+    for job_id, future in list(_local_futures.items()):
+        if future.cancel():
+            job_tracker.update_status(job_id, JobStatus.CANCELLED)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_local_executor)
+
+
+def _read_ray_flag() -> bool:
+    """Return True when EVO_AI_USE_RAY enables Ray execution."""
     flag = os.getenv("EVO_AI_USE_RAY", "").strip().lower()
     return flag in ("1", "true", "yes")
 
 
+# Resolved once at import; call reload_ray_flag() after changing the env var
+_USE_RAY = _read_ray_flag()
+
+
+def reload_ray_flag() -> bool:
+    """Re-read EVO_AI_USE_RAY from the environment (mainly for tests)."""
+    global _USE_RAY
+    _USE_RAY = _read_ray_flag()
+    return _USE_RAY
+
+
 async def _run_round_async(
     job_id: UUID,
     campaign_id: UUID,
@@ -31,7 +92,7 @@ async def _run_round_async(
     """Run a round without Ray and update job status."""
     job_tracker.update_status(job_id, JobStatus.RUNNING, progress=0.0)
     try:
-        orchestrator = AgentOrchestrator(mcp_registry)
+        orchestrator = _get_orchestrator()
         result = await orchestrator.execute_round(
             campaign_id=campaign_id,
             round_number=round_number,
@@ -57,7 +118,7 @@ async def _run_campaign_async(
     """Run a campaign without Ray and update job status."""
     job_tracker.update_status(job_id, JobStatus.RUNNING, progress=0.0)
     try:
-        orchestrator = AgentOrchestrator(mcp_registry)
+        orchestrator = _get_orchestrator()
         result = await orchestrator.execute_campaign(
             campaign_id=campaign_id,
             max_rounds=max_rounds
@@ -72,6 +133,36 @@ async def _run_campaign_async(
         job_tracker.update_status(job_id, JobStatus.FAILED, error=str(exc))
 
 
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the persistent event loop for the current thread.
+
+    The loop is created lazily and reused across jobs run on the same thread,
+    so clients and connection pools bound to it survive between rounds.
+    """
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def _get_orchestrator() -> AgentOrchestrator:
+    """Return this thread's orchestrator, creating it on first use."""
+    orchestrator = getattr(_thread_state, "orchestrator", None)
+    if orchestrator is None:
+        orchestrator = AgentOrchestrator(mcp_registry)
+        _thread_state.orchestrator = orchestrator
+    return orchestrator
+
+
+def _submit_local(job_id: UUID, target: Callable[..., None], *args: Any) -> None:
+    """Queue a local job on the worker pool and remember its future."""
+    future = _get_local_executor().submit(target, job_id, *args)
+    _local_futures[job_id] = future
+    future.add_done_callback(lambda _: _local_futures.pop(job_id, None))
+
+
 def _run_round_local(
     job_id: UUID,
     campaign_id: UUID,
@@ -79,7 +170,9 @@ def _run_round_local(
     trace_id: UUID
 ) -> None:
     """Fallback runner when no event loop is available."""
-    asyncio.run(_run_round_async(job_id, campaign_id, round_number, trace_id))
+    _get_thread_loop().run_until_complete(
+        _run_round_async(job_id, campaign_id, round_number, trace_id)
+    )
 
 
 def _run_campaign_local(
@@ -89,7 +182,9 @@ def _run_campaign_local(
     trace_id: UUID
 ) -> None:
     """Fallback runner when no event loop is available."""
-    asyncio.run(_run_campaign_async(job_id, campaign_id, max_rounds, trace_id))
+    _get_thread_loop().run_until_complete(
+        _run_campaign_async(job_id, campaign_id, max_rounds, trace_id)
+    )
 
 
 @ray.remote
@@ -113,13 +208,14 @@ def execute_round_remote(
     """
     campaign_uuid = UUID(campaign_id)
     trace_uuid = UUID(trace_id) if trace_id else uuid4()
+    trace_str = trace_id or str(trace_uuid)
     job_uuid = UUID(job_id) if job_id else None
 
     logger.info(
         "ray_round_execution_started",
         campaign_id=campaign_id,
         round_number=round_number,
-        trace_id=str(trace_uuid),
+        trace_id=trace_str,
         job_id=job_id
     )
 
@@ -128,11 +224,10 @@ def execute_round_remote(
         job_tracker.update_status(job_uuid, JobStatus.RUNNING, progress=0.0)
 
     try:
-        # Create orchestrator
-        orchestrator = AgentOrchestrator(mcp_registry)
+        orchestrator = _get_orchestrator()
 
-        # Execute round
-        result = ray.get(
+        # Execute round (orchestrator is async; drive it on this worker's loop)
+        result = _get_thread_loop().run_until_complete(
             orchestrator.execute_round(
                 campaign_id=campaign_uuid,
                 round_number=round_number,
@@ -199,13 +294,14 @@ def execute_campaign_remote(
     """
     campaign_uuid = UUID(campaign_id)
     trace_uuid = UUID(trace_id) if trace_id else uuid4()
+    trace_str = trace_id or str(trace_uuid)
     job_uuid = UUID(job_id) if job_id else None
 
     logger.info(
         "ray_campaign_execution_started",
         campaign_id=campaign_id,
         max_rounds=max_rounds,
-        trace_id=str(trace_uuid),
+        trace_id=trace_str,
         job_id=job_id
     )
 
@@ -214,11 +310,10 @@ def execute_campaign_remote(
         job_tracker.update_status(job_uuid, JobStatus.RUNNING, progress=0.0)
 
     try:
-        # Create orchestrator
-        orchestrator = AgentOrchestrator(mcp_registry)
+        orchestrator = _get_orchestrator()
 
-        # Execute campaign
-        result = ray.get(
+        # Execute campaign (orchestrator is async; drive it on this worker's loop)
+        result = _get_thread_loop().run_until_complete(
             orchestrator.execute_campaign(
                 campaign_id=campaign_uuid,
                 max_rounds=max_rounds
@@ -290,24 +385,30 @@ def execute_round_task(
         trace_id=trace_uuid
     )
 
-    if _use_ray():
+    # Submission response, shared by the Ray and local paths
+    job_id_str = str(job.job_id)
+    campaign_str = str(campaign_id)
+    trace_str = str(trace_uuid)
+    payload = {
+        "job_id": job_id_str,
+        "status": job.status.value,
+        "task_type": "execute_round",
+        "campaign_id": campaign_str,
+        "round_number": round_number,
+        "trace_id": trace_str
+    }
+
+    if _USE_RAY:
         try:
             task_ref = execute_round_remote.remote(
-                campaign_id=str(campaign_id),
+                campaign_id=campaign_str,
                 round_number=round_number,
-                trace_id=str(trace_uuid),
-                job_id=str(job.job_id)
+                trace_id=trace_str,
+                job_id=job_id_str
             )
 
             if async_execution:
-                return {
-                    "job_id": str(job.job_id),
-                    "status": job.status.value,
-                    "task_type": "execute_round",
-                    "campaign_id": str(campaign_id),
-                    "round_number": round_number,
-                    "trace_id": str(trace_uuid)
-                }
+                return payload
             result = ray.get(task_ref)
             return result
         except Exception as exc:
@@ -324,21 +425,11 @@ def execute_round_task(
                 _run_round_async(job.job_id, campaign_id, round_number, trace_uuid)
             )
         else:
-            thread = threading.Thread(
-                target=_run_round_local,
-                args=(job.job_id, campaign_id, round_number, trace_uuid),
-                daemon=True
+            _submit_local(
+                job.job_id, _run_round_local, campaign_id, round_number, trace_uuid
             )
-            thread.start()
 
-        return {
-            "job_id": str(job.job_id),
-            "status": job.status.value,
-            "task_type": "execute_round",
-            "campaign_id": str(campaign_id),
-            "round_number": round_number,
-            "trace_id": str(trace_uuid)
-        }
+        return payload
 
     _run_round_local(job.job_id, campaign_id, round_number, trace_uuid)
     status = job_tracker.get_job(job.job_id)
@@ -373,24 +464,30 @@ def execute_campaign_task(
         trace_id=trace_uuid
     )
 
-    if _use_ray():
+    # Submission response, shared by the Ray and local paths
+    job_id_str = str(job.job_id)
+    campaign_str = str(campaign_id)
+    trace_str = str(trace_uuid)
+    payload = {
+        "job_id": job_id_str,
+        "status": job.status.value,
+        "task_type": "execute_campaign",
+        "campaign_id": campaign_str,
+        "max_rounds": max_rounds,
+        "trace_id": trace_str
+    }
+
+    if _USE_RAY:
         try:
             task_ref = execute_campaign_remote.remote(
-                campaign_id=str(campaign_id),
+                campaign_id=campaign_str,
                 max_rounds=max_rounds,
-                trace_id=str(trace_uuid),
-                job_id=str(job.job_id)
+                trace_id=trace_str,
+                job_id=job_id_str
             )
 
             if async_execution:
-                return {
-                    "job_id": str(job.job_id),
-                    "status": job.status.value,
-                    "task_type": "execute_campaign",
-                    "campaign_id": str(campaign_id),
-                    "max_rounds": max_rounds,
-                    "trace_id": str(trace_uuid)
-                }
+                return payload
             result = ray.get(task_ref)
             return result
         except Exception as exc:
@@ -407,21 +504,11 @@ def execute_campaign_task(
                 _run_campaign_async(job.job_id, campaign_id, max_rounds, trace_uuid)
             )
         else:
-            thread = threading.Thread(
-                target=_run_campaign_local,
-                args=(job.job_id, campaign_id, max_rounds, trace_uuid),
-                daemon=True
+            _submit_local(
+                job.job_id, _run_campaign_local, campaign_id, max_rounds, trace_uuid
             )
-            thread.start()
 
-        return {
-            "job_id": str(job.job_id),
-            "status": job.status.value,
-            "task_type": "execute_campaign",
-            "campaign_id": str(campaign_id),
-            "max_rounds": max_rounds,
-            "trace_id": str(trace_uuid)
-        }
+        return payload
 
     _run_campaign_local(job.job_id, campaign_id, max_rounds, trace_uuid)
     status = job_tracker.get_job(job.job_id)
@@ -443,20 +530,7 @@ def get_task_status(job_id: UUID) -> Optional[Dict[str, Any]]:
     if not job:
         return None
 
-    return {
-        "job_id": str(job.job_id),
-        "task_type": job.task_type,
-        "status": job.status.value,
-        "campaign_id": str(job.campaign_id) if job.campaign_id else None,
-        "round_number": job.round_number,
-        "progress": job.progress,
-        "result": job.result,
-        "error": job.error,
-        "created_at": job.created_at.isoformat(),
-        "started_at": job.started_at.isoformat() if job.started_at else None,
-        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-        "duration_seconds": job.duration_seconds,
-    }
+    return job.to_dict()
 
 
 def cancel_task(job_id: UUID) -> bool:
@@ -474,9 +548,14 @@ def cancel_task(job_id: UUID) -> bool:
     if not job:
         return False
 
-    if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+    if job.status in TERMINAL_STATUSES:
         return False
 
+    # Drop the job from the local pool if it has not started yet
+    future = _local_futures.pop(job_id, None)
+    if future is not None:
+        future.cancel()
+
     # Update status to cancelled
     job_tracker.update_status(job_id, JobStatus.CANCELLED)
 
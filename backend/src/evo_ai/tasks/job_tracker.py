@@ -1,15 +1,32 @@
 """Job tracking for Ray tasks."""
 
+import asyncio
+import heapq
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, cast
 from uuid import UUID, uuid4
 
+import orjson
+import redis
 import structlog
-from pydantic import BaseModel, Field
+
+from evo_ai.config import settings
+from evo_ai.infrastructure.observability.logging import is_enabled_for
 
 logger = structlog.get_logger(__name__)
 
+# Sort key for newest-first listings
+_CREATED_AT = attrgetter("created_at")
+
+_T = TypeVar("_T")
+
 
 class JobStatus(str, Enum):
     """Job execution status."""
@@ -20,42 +37,408 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class Job(BaseModel):
-    """Job tracking model."""
-    job_id: UUID = Field(default_factory=uuid4)
+# Statuses a job never leaves once reached
+TERMINAL_STATUSES: frozenset[JobStatus] = frozenset({
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+})
+
+
+@dataclass(slots=True, kw_only=True)
+class Job:
+    """
+    Job tracking record.
+
+    A plain slotted dataclass: jobs are created and mutated only by the
+    tracker, so there is no validation on the hot path. Use to_dict() at API
+    boundaries.
+    """
+    # Kept as UUID rather than raw bytes: routes and task runners pass UUIDs,
+    # and UUID.bytes builds a new bytes object on every access
+    job_id: UUID = field(default_factory=uuid4)
     task_type: str  # "execute_round", "execute_campaign", etc.
     status: JobStatus = JobStatus.PENDING
     campaign_id: Optional[UUID] = None
     round_number: Optional[int] = None
     trace_id: Optional[UUID] = None
     result: Optional[Dict[str, Any]] = None
+    result_json: Optional[bytes] = None  # result encoded once, for responses
     error: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_ts: Optional[float] = None  # epoch seconds
+    completed_ts: Optional[float] = None  # epoch seconds
     progress: float = 0.0  # 0.0 to 1.0
 
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Start time as a naive UTC datetime."""
+        return _utc_datetime(self.started_ts)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Completion time as a naive UTC datetime."""
+        return _utc_datetime(self.completed_ts)
+
     @property
     def duration_seconds(self) -> Optional[float]:
         """Calculate job duration in seconds."""
-        if not self.started_at:
+        if self.started_ts is None:
+            return None
+        end_ts = self.completed_ts if self.completed_ts is not None else time.time()
+        return end_ts - self.started_ts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize job for API responses."""
+        return {
+            "job_id": str(self.job_id),
+            "task_type": self.task_type,
+            "status": self.status.value,
+            "campaign_id": str(self.campaign_id) if self.campaign_id else None,
+            "round_number": self.round_number,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": _isoformat(self.started_ts),
+            "completed_at": _isoformat(self.completed_ts),
+            "duration_seconds": self.duration_seconds,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize job for API responses as JSON, reusing the encoded result."""
+        data = self.to_dict()
+        if self.result is not None:
+            if self.result_json is None:
+                self.result_json = orjson.dumps(self.result, default=str)
+            data["result"] = orjson.Fragment(self.result_json)
+        return orjson.dumps(data)
+
+
+def _utc_datetime(ts: Optional[float]) -> Optional[datetime]:
+    return datetime.utcfromtimestamp(ts) if ts is not None else None
+
+
+def _isoformat(ts: Optional[float]) -> Optional[str]:
+    return datetime.utcfromtimestamp(ts).isoformat() if ts is not None else None
+
+
+def _parse_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _json_default(value: Any) -> Any:
+    # result_json duplicates result; store it as null and rebuild on demand
+    if isinstance(value, bytes):
+        return None
+    return str(value)
+
+
+def _job_from_json(data: str | bytes) -> Job:
+    """Rebuild a Job from its orjson-serialized form."""
+    raw = orjson.loads(data)
+    return Job(
+        job_id=UUID(raw["job_id"]),
+        task_type=raw["task_type"],
+        status=JobStatus(raw["status"]),
+        campaign_id=_parse_uuid(raw["campaign_id"]),
+        round_number=raw["round_number"],
+        trace_id=_parse_uuid(raw["trace_id"]),
+        result=raw["result"],
+        error=raw["error"],
+        created_at=datetime.fromisoformat(raw["created_at"]),
+        started_ts=raw["started_ts"],
+        completed_ts=raw["completed_ts"],
+        progress=raw["progress"],
+    )
+
+
+def _apply_status(
+    job: Job,
+    status: JobStatus,
+    progress: Optional[float],
+    result: Optional[Dict[str, Any]],
+    error: Optional[str]
+) -> None:
+    """Apply a status transition and optional fields to a job in place."""
+    job.status = status
+
+    if status == JobStatus.RUNNING and job.started_ts is None:
+        job.started_ts = time.time()
+
+    if status in TERMINAL_STATUSES:
+        job.completed_ts = time.time()
+
+    if progress is not None:
+        job.progress = min(max(progress, 0.0), 1.0)
+
+    if result is not None:
+        job.result = result
+        job.result_json = orjson.dumps(result, default=str)
+
+    if error is not None:
+        job.error = error
+
+
+# Number of in-memory tracker shards (power of two)
+_SHARD_COUNT = 16
+
+# How long finished jobs are kept before timer-driven expiry
+JOB_TTL_SECONDS = 24 * 3600
+
+# Salt mixed into the shard hash so shard choice is independent of dict/set hashing
+_SHARD_SALT = 0xA5A5
+
+
+class _JobShard:
+    """
+    One shard of the in-memory tracker.
+
+    Jobs live in a slot list; UUIDs are resolved to a slot once per call and
+    all internal indexes hold integer slots. Jobs are indexed by campaign and
+    status so filtered listings only touch matching jobs, and finished jobs
+    are kept ordered by completion time so cleanup only walks the expired
+    prefix. Mutations hold the shard lock; single-key reads do not, and
+    check that the slot they land on still holds the requested job.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every job and index."""
+        with self.lock:
+            self.slots: List[Optional[Job]] = []
+            self.slot_of: Dict[UUID, int] = {}
+            self.free_slots: List[int] = []
+            self.by_campaign: Dict[UUID, set[int]] = {}
+            self.by_status: Dict[JobStatus, set[int]] = {status: set() for status in JobStatus}
+            # Min-heap of (completed_ts, slot, job_id); may hold stale entries
+            self.by_completed: List[tuple[float, int, UUID]] = []
+
+    def add(self, job: Job) -> None:
+        """Store a new job and index it."""
+        with self.lock:
+            if self.free_slots:
+                slot = self.free_slots.pop()
+                self.slots[slot] = job
+            else:
+                slot = len(self.slots)
+                self.slots.append(job)
+            self.slot_of[job.job_id] = slot
+
+            self.by_status[job.status].add(slot)
+            if job.campaign_id:
+                self.by_campaign.setdefault(job.campaign_id, set()).add(slot)
+
+    def _job_at(self, slot: int) -> Job:
+        """Return the job in an occupied slot (lock held)."""
+        job = self.slots[slot]
+        assert job is not None, "indexed slot is empty"
+        return job
+
+    def get(self, job_id: UUID) -> Optional[Job]:
+        """Look up a job by ID without taking the lock."""
+        slots = self.slots
+        slot = self.slot_of.get(job_id)
+        if slot is None or slot >= len(slots):
             return None
-        end_time = self.completed_at or datetime.utcnow()
-        return (end_time - self.started_at).total_seconds()
+        # A concurrent delete may have freed the slot and a create reused it
+        job = slots[slot]
+        return job if job is not None and job.job_id == job_id else None
+
+    def update(
+        self,
+        job_id: UUID,
+        status: JobStatus,
+        progress: Optional[float],
+        result: Optional[Dict[str, Any]],
+        error: Optional[str]
+    ) -> Optional[Job]:
+        """Apply a status update and maintain the indexes."""
+        with self.lock:
+            slot = self.slot_of.get(job_id)
+            if slot is None:
+                return None
+
+            job = self._job_at(slot)
+            previous = job.status
+            _apply_status(job, status, progress, result, error)
+
+            if previous != status:
+                self.by_status[previous].discard(slot)
+                self.by_status[status].add(slot)
+
+            completed_ts = job.completed_ts
+            if status in TERMINAL_STATUSES and completed_ts is not None:
+                heapq.heappush(self.by_completed, (completed_ts, slot, job_id))
+
+            return job
+
+    def expire_job(self, job_id: UUID, completed_ts: float) -> bool:
+        """Delete a job if it is still finished at the given completion time."""
+        with self.lock:
+            slot = self.slot_of.get(job_id)
+            if slot is None:
+                return False
+            job = self._job_at(slot)
+            # A re-completed or re-opened job keeps living until its own timer
+            if job.completed_ts != completed_ts or job.status not in TERMINAL_STATUSES:
+                return False
+            self._remove(slot, job)
+            # Timers fire in roughly completion order, so this keeps the heap
+            # bounded when cleanup_old_jobs is never called
+            self._prune_completed()
+            return True
+
+    def select(
+        self,
+        campaign_id: Optional[UUID],
+        status: Optional[JobStatus]
+    ) -> List[Job]:
+        """Return jobs matching the filters, newest first."""
+        with self.lock:
+            job_at = self._job_at
+            if not (campaign_id or status):
+                # slot_of preserves insertion order, which is creation order
+                slot_of = self.slot_of
+                return [job_at(slot_of[job_id]) for job_id in reversed(slot_of)]
+
+            candidates: set[int]
+            if campaign_id:
+                candidates = self.by_campaign.get(campaign_id, set())
+                if status:
+                    candidates = candidates & self.by_status[status]
+            else:
+                assert status is not None
+                candidates = self.by_status[status]
+            jobs = [job_at(slot) for slot in candidates]
+
+        jobs.sort(key=_CREATED_AT, reverse=True)
+        return jobs
+
+    def delete(self, job_id: UUID) -> bool:
+        """Delete a job by ID."""
+        with self.lock:
+            slot = self.slot_of.get(job_id)
+            if slot is None:
+                return False
+            self._remove(slot, self._job_at(slot))
+            return True
+
+    def expire(self, cutoff: float) -> int:
+        """Delete finished jobs completed before cutoff (epoch seconds)."""
+        deleted = 0
+        with self.lock:
+            heap = self.by_completed
+            while heap and heap[0][0] < cutoff:
+                entry = heapq.heappop(heap)
+                # Skip entries for deleted/reused slots or superseded completion times
+                if not self._is_current(entry):
+                    continue
+                slot = entry[1]
+                self._remove(slot, self._job_at(slot))
+                deleted += 1
+        return deleted
+
+    def _is_current(self, entry: tuple[float, int, UUID]) -> bool:
+        """Whether a completion heap entry still describes a finished job (lock held)."""
+        completed_ts, slot, job_id = entry
+        job = self.slots[slot]
+        return (
+            job is not None
+            and job.job_id == job_id
+            and job.completed_ts == completed_ts
+            and job.status in TERMINAL_STATUSES
+        )
+
+    def _prune_completed(self) -> None:
+        """Pop stale entries off the top of the completion heap (lock held)."""
+        heap = self.by_completed
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+
+    def _remove(self, slot: int, job: Job) -> None:
+        """Free a job's slot and drop it from the indexes (lock held)."""
+        del self.slot_of[job.job_id]
+        self.slots[slot] = None
+        self.free_slots.append(slot)
+
+        self.by_status[job.status].discard(slot)
+        if job.campaign_id:
+            campaign_jobs = self.by_campaign.get(job.campaign_id)
+            if campaign_jobs is not None:
+                campaign_jobs.discard(slot)
+                if not campaign_jobs:
+                    del self.by_campaign[job.campaign_id]
 
 
 class JobTracker:
     """
     In-memory job tracker for Ray tasks.
 
-    In production, this would persist to Redis or database.
+    Jobs are spread over _SHARD_COUNT shards, each with its own lock, so
+    updates from different worker threads rarely contend. Once an event
+    loop is attached, each finished job is expired by its own timer after
+    ttl_seconds; cleanup_old_jobs remains for callers without a loop. Use
+    RedisJobTracker to share state across processes.
     """
 
-    def __init__(self):
-        """Initialize job tracker."""
-        self._jobs: Dict[UUID, Job] = {}
+    def __init__(self, ttl_seconds: float = JOB_TTL_SECONDS):
+        """
+        Initialize job tracker.
+
+        Args:
+            ttl_seconds: Lifetime of finished jobs when a loop is attached
+        """
+        self._shards = [_JobShard() for _ in range(_SHARD_COUNT)]
+        self._ttl_seconds = ttl_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info("job_tracker_initialized")
 
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Expire finished jobs with timers on the given event loop.
+
+        Args:
+            loop: Loop to schedule expiry on, or None to stop scheduling
+        """
+        self._loop = loop
+
+    def reset(self) -> None:
+        """
+        Drop all jobs, keeping the shards and any attached loop.
+
+        Lets tests reuse one tracker instead of building a new one per test.
+        Timers armed before the reset find nothing to expire.
+        """
+        for shard in self._shards:
+            shard.clear()
+
+    def _schedule_expiry(self, job_id: UUID, completed_ts: float) -> None:
+        """Arm the TTL timer for a finished job (safe from any thread)."""
+        # Bind once: attach_loop(None) may run concurrently
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(
+                loop.call_later, self._ttl_seconds, self._expire_job, job_id, completed_ts
+            )
+        except RuntimeError:
+            # Loop closed; cleanup_old_jobs still reclaims the job
+            self._loop = None
+
+    def _expire_job(self, job_id: UUID, completed_ts: float) -> None:
+        """Timer callback removing a job whose TTL elapsed."""
+        if self._shard(job_id).expire_job(job_id, completed_ts) and is_enabled_for(logging.INFO):
+            logger.info("job_expired", job_id=str(job_id))
+
+    def _shard(self, job_id: UUID) -> _JobShard:
+        """Return the shard that owns a job ID."""
+        return self._shards[hash((job_id.int, _SHARD_SALT)) & (_SHARD_COUNT - 1)]
+
     def create_job(
         self,
         task_type: str,
@@ -82,20 +465,21 @@ class JobTracker:
             trace_id=trace_id
         )
 
-        self._jobs[job.job_id] = job
+        self._shard(job.job_id).add(job)
 
-        logger.info(
-            "job_created",
-            job_id=str(job.job_id),
-            task_type=task_type,
-            campaign_id=str(campaign_id) if campaign_id else None
-        )
+        if is_enabled_for(logging.INFO):
+            logger.info(
+                "job_created",
+                job_id=str(job.job_id),
+                task_type=task_type,
+                campaign_id=str(campaign_id) if campaign_id else None
+            )
 
         return job
 
     def get_job(self, job_id: UUID) -> Optional[Job]:
         """Get job by ID."""
-        return self._jobs.get(job_id)
+        return self._shard(job_id).get(job_id)
 
     def update_status(
         self,
@@ -118,34 +502,22 @@ class JobTracker:
         Returns:
             Updated job or None if not found
         """
-        job = self._jobs.get(job_id)
+        job = self._shard(job_id).update(job_id, status, progress, result, error)
         if not job:
             logger.warning("job_not_found", job_id=str(job_id))
             return None
 
-        job.status = status
+        if status in TERMINAL_STATUSES and job.completed_ts is not None:
+            self._schedule_expiry(job_id, job.completed_ts)
 
-        if status == JobStatus.RUNNING and not job.started_at:
-            job.started_at = datetime.utcnow()
-
-        if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.completed_at = datetime.utcnow()
-
-        if progress is not None:
-            job.progress = min(max(progress, 0.0), 1.0)
-
-        if result is not None:
-            job.result = result
-
-        if error is not None:
-            job.error = error
-
-        logger.info(
-            "job_status_updated",
-            job_id=str(job_id),
-            status=status.value,
-            progress=job.progress
-        )
+        if is_enabled_for(logging.INFO):
+            logger.info(
+                "job_status_updated",
+                job_id=str(job_id),
+                status=status.value,
+                progress=job.progress,
+                result_size=len(job.result_json) if job.result_json is not None else None
+            )
 
         return job
 
@@ -164,15 +536,12 @@ class JobTracker:
         Returns:
             List of matching jobs
         """
-        jobs = list(self._jobs.values())
-
-        if campaign_id:
-            jobs = [j for j in jobs if j.campaign_id == campaign_id]
-
-        if status:
-            jobs = [j for j in jobs if j.status == status]
-
-        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+        # Shards return newest-first runs, so a k-way merge replaces a full sort
+        return list(heapq.merge(
+            *(shard.select(campaign_id, status) for shard in self._shards),
+            key=_CREATED_AT,
+            reverse=True
+        ))
 
     def delete_job(self, job_id: UUID) -> bool:
         """
@@ -184,11 +553,12 @@ class JobTracker:
         Returns:
             True if deleted, False if not found
         """
-        if job_id in self._jobs:
-            del self._jobs[job_id]
+        if not self._shard(job_id).delete(job_id):
+            return False
+
+        if is_enabled_for(logging.INFO):
             logger.info("job_deleted", job_id=str(job_id))
-            return True
-        return False
+        return True
 
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """
@@ -200,22 +570,289 @@ class JobTracker:
         Returns:
             Number of jobs deleted
         """
-        cutoff = datetime.utcnow().timestamp() - (max_age_hours * 3600)
-        to_delete = []
+        cutoff = time.time() - (max_age_hours * 3600)
+
+        # Each shard pops only expired entries; no per-job datetime work
+        deleted = sum(shard.expire(cutoff) for shard in self._shards)
+
+        if deleted:
+            logger.info("jobs_cleaned_up", count=deleted)
 
-        for job_id, job in self._jobs.items():
-            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                if job.completed_at and job.completed_at.timestamp() < cutoff:
-                    to_delete.append(job_id)
+        return deleted
 
-        for job_id in to_delete:
-            del self._jobs[job_id]
 
-        if to_delete:
-            logger.info("jobs_cleaned_up", count=len(to_delete))
+class RedisJobTracker:
+    """
+    Redis-backed job tracker shared by all API and Ray worker processes.
+
+    Layout (all keys under ``prefix``):
+    - ``job:{id}``: hash with the serialized job plus indexed fields
+    - ``jobs:by_created``: sorted set of job IDs scored by creation time
+    - ``jobs:by_completed``: sorted set of finished job IDs scored by completion time
+    - ``jobs:campaign:{id}`` / ``jobs:status:{status}``: sets of job IDs
+
+    Creates run in a single MULTI/EXEC pipeline. Updates and deletes read
+    the job under WATCH and queue their writes in MULTI/EXEC, retrying if
+    another process changed the job in between, so the hash and its index
+    entries always move together. Exposes the same synchronous interface
+    as JobTracker.
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "evo_ai") -> None:
+        """
+        Initialize Redis job tracker.
+
+        Args:
+            client: Redis client (created with decode_responses=True)
+            prefix: Key namespace
+        """
+        self._redis = client
+        self._prefix = prefix
+        logger.info("redis_job_tracker_initialized", prefix=prefix)
+
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        No-op: state is shared across processes, so per-process timers
+        would race. Expire jobs with cleanup_old_jobs instead.
+        """
+
+    def _job_key(self, job_id: UUID | str) -> str:
+        return f"{self._prefix}:job:{job_id}"
 
-        return len(to_delete)
+    def _campaign_key(self, campaign_id: UUID | str) -> str:
+        return f"{self._prefix}:jobs:campaign:{campaign_id}"
+
+    def _status_key(self, status: JobStatus | str) -> str:
+        value = status.value if isinstance(status, JobStatus) else status
+        return f"{self._prefix}:jobs:status:{value}"
+
+    @property
+    def _created_key(self) -> str:
+        return f"{self._prefix}:jobs:by_created"
+
+    @property
+    def _completed_key(self) -> str:
+        return f"{self._prefix}:jobs:by_completed"
+
+    def _write(self, pipe: Any, job: Job) -> None:
+        """Queue the HSET for a job on a pipeline."""
+        pipe.hset(
+            self._job_key(job.job_id),
+            mapping={
+                "data": orjson.dumps(job, default=_json_default),
+                "status": job.status.value,
+                "campaign_id": str(job.campaign_id) if job.campaign_id else "",
+            }
+        )
+
+    def _read(self, pipe: Any, job_id: UUID | str) -> Optional[Job]:
+        """Read a job through a pipeline in immediate (WATCH) mode."""
+        data = pipe.hget(self._job_key(job_id), "data")
+        return _job_from_json(data) if data else None
+
+    def _transaction(self, keys: List[str], func: Callable[[Any], _T]) -> _T:
+        """
+        Run func with keys WATCHed and execute what it queues atomically.
+
+        func reads through the pipeline, calls pipe.multi() before queueing
+        writes, and is re-run from scratch if a watched key changed.
+        """
+        # Pipeline methods are untyped; the redis calls stay behind Any
+        pipe: Any = self._redis.pipeline()
+        with pipe:
+            while True:
+                try:
+                    pipe.watch(*keys)
+                    value = func(pipe)
+                    pipe.execute()
+                    return value
+                except redis.WatchError:
+                    continue
+
+    def _load_many(self, job_ids: List[str]) -> List[Job]:
+        """Fetch and deserialize jobs in one round trip, skipping missing ones."""
+        if not job_ids:
+            return []
+        pipe: Any = self._redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hget(self._job_key(job_id), "data")
+        return [_job_from_json(data) for data in pipe.execute() if data]
+
+    def create_job(
+        self,
+        task_type: str,
+        campaign_id: Optional[UUID] = None,
+        round_number: Optional[int] = None,
+        trace_id: Optional[UUID] = None
+    ) -> Job:
+        """Create a new job (see JobTracker.create_job)."""
+        job = Job(
+            task_type=task_type,
+            campaign_id=campaign_id,
+            round_number=round_number,
+            trace_id=trace_id
+        )
+        job_id = str(job.job_id)
+
+        pipe: Any = self._redis.pipeline()
+        self._write(pipe, job)
+        pipe.zadd(self._created_key, {job_id: job.created_at.timestamp()})
+        pipe.sadd(self._status_key(job.status), job_id)
+        if campaign_id:
+            pipe.sadd(self._campaign_key(campaign_id), job_id)
+        pipe.execute()
+
+        logger.info(
+            "job_created",
+            job_id=job_id,
+            task_type=task_type,
+            campaign_id=str(campaign_id) if campaign_id else None
+        )
+
+        return job
+
+    def get_job(self, job_id: UUID) -> Optional[Job]:
+        """Get job by ID."""
+        data = cast(Optional[str], self._redis.hget(self._job_key(job_id), "data"))
+        return _job_from_json(data) if data else None
+
+    def update_status(
+        self,
+        job_id: UUID,
+        status: JobStatus,
+        progress: Optional[float] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> Optional[Job]:
+        """Update job status (see JobTracker.update_status)."""
+        job_id_str = str(job_id)
+
+        def apply(pipe: Any) -> Optional[Job]:
+            job = self._read(pipe, job_id)
+            if not job:
+                # Queue nothing: a deleted job must not be recreated by HSET
+                return None
+
+            previous = job.status
+            _apply_status(job, status, progress, result, error)
+
+            pipe.multi()
+            self._write(pipe, job)
+            if previous != status:
+                pipe.smove(self._status_key(previous), self._status_key(status), job_id_str)
+            if job.completed_ts is not None:
+                pipe.zadd(self._completed_key, {job_id_str: job.completed_ts})
+            return job
+
+        job = self._transaction([self._job_key(job_id)], apply)
+        if not job:
+            logger.warning("job_not_found", job_id=job_id_str)
+            return None
+
+        logger.info(
+            "job_status_updated",
+            job_id=job_id_str,
+            status=status.value,
+            progress=job.progress,
+            result_size=len(job.result_json) if job.result_json is not None else None
+        )
+
+        return job
+
+    def list_jobs(
+        self,
+        campaign_id: Optional[UUID] = None,
+        status: Optional[JobStatus] = None
+    ) -> list[Job]:
+        """List jobs with optional filters, newest first."""
+        filters = []
+        if campaign_id:
+            filters.append(self._campaign_key(campaign_id))
+        if status:
+            filters.append(self._status_key(status))
+
+        if not filters:
+            return self._load_many(
+                cast(List[str], self._redis.zrevrange(self._created_key, 0, -1))
+            )
+
+        jobs = self._load_many(list(cast(Set[str], self._redis.sinter(filters))))
+        jobs.sort(key=_CREATED_AT, reverse=True)
+        return jobs
+
+    def delete_job(self, job_id: UUID) -> bool:
+        """Delete job (see JobTracker.delete_job)."""
+        def remove(pipe: Any) -> bool:
+            job = self._read(pipe, job_id)
+            if not job:
+                return False
+            # The status read under WATCH is the set the ID actually sits in
+            pipe.multi()
+            self._queue_delete(pipe, job)
+            return True
+
+        if not self._transaction([self._job_key(job_id)], remove):
+            return False
+
+        logger.info("job_deleted", job_id=str(job_id))
+        return True
+
+    def _queue_delete(self, pipe: Any, job: Job) -> None:
+        """Queue removal of a job and its index entries."""
+        job_id = str(job.job_id)
+        pipe.delete(self._job_key(job_id))
+        pipe.zrem(self._created_key, job_id)
+        pipe.zrem(self._completed_key, job_id)
+        pipe.srem(self._status_key(job.status), job_id)
+        if job.campaign_id:
+            pipe.srem(self._campaign_key(job.campaign_id), job_id)
+
+    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
+        """Cleanup finished jobs older than max_age_hours."""
+        cutoff = time.time() - (max_age_hours * 3600)
+        expired = cast(
+            List[str], self._redis.zrangebyscore(self._completed_key, "-inf", cutoff)
+        )
+        if not expired:
+            return 0
+
+        def remove(pipe: Any) -> int:
+            # Re-read under WATCH: jobs may have been deleted or re-completed since
+            jobs: List[Job] = []
+            stale: List[str] = []  # deleted or re-opened; only the index entry goes
+            for job_id in expired:
+                job = self._read(pipe, job_id)
+                if job is None or job.status not in TERMINAL_STATUSES:
+                    stale.append(job_id)
+                elif job.completed_ts is not None and job.completed_ts < cutoff:
+                    jobs.append(job)
+
+            pipe.multi()
+            for job in jobs:
+                self._queue_delete(pipe, job)
+            if stale:
+                pipe.zrem(self._completed_key, *stale)
+            return len(jobs)
+
+        deleted = self._transaction([self._job_key(job_id) for job_id in expired], remove)
+        if deleted:
+            logger.info("jobs_cleaned_up", count=deleted)
+
+        return deleted
+
+
+def create_job_tracker() -> JobTracker | RedisJobTracker:
+    """
+    Build the job tracker selected by EVO_AI_JOB_STORE.
+
+    "redis" shares job state across processes via settings.redis_url;
+    anything else (the default) keeps jobs in process memory.
+    """
+    if os.getenv("EVO_AI_JOB_STORE", "memory").strip().lower() == "redis":
+        client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+        return RedisJobTracker(client)
+    return JobTracker()
 
 
 # Global job tracker instance
-job_tracker = JobTracker()
+job_tracker = create_job_tracker()
@@ -1,13 +1,92 @@
 """Ray cluster configuration and initialization."""
 
+import functools
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Protocol, TypeVar, cast
 
 import ray
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Last known Ray state, updated by init_ray/shutdown_ray
+_ray_state = {"initialized": False}
+
+_V = TypeVar("_V")
+_V_co = TypeVar("_V_co", covariant=True)
+
+# How long cluster state snapshots are reused before asking the GCS again
+CLUSTER_INFO_TTL_SECONDS = 1.0
+
+
+class _TTLCached(Protocol[_V_co]):
+    """A zero-argument function wrapped by _ttl_cache."""
+
+    def __call__(self) -> _V_co: ...
+
+    def cache_clear(self) -> None: ...
+
+
+def _ttl_cache(ttl: float) -> Callable[[Callable[[], _V]], _TTLCached[_V]]:
+    """
+    Cache a zero-argument function's result for ttl seconds.
+
+    The wrapped function gains cache_clear() to drop the cached value.
+    """
+    def decorator(func: Callable[[], _V]) -> _TTLCached[_V]:
+        entry: list[tuple[float, _V]] = []
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper() -> _V:
+            with lock:
+                now = time.monotonic()
+                if entry and now - entry[0][0] < ttl:
+                    return entry[0][1]
+                value = func()
+                entry[:] = [(now, value)]
+                return value
+
+        def cache_clear() -> None:
+            with lock:
+                entry.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return cast(_TTLCached[_V], wrapper)
+
+    return decorator
+
+
+def is_ray_initialized(force_refresh: bool = False) -> bool:
+    """
+    Return whether Ray is initialized in this process.
+
+    A cached True is trusted; a cached False is rechecked with Ray, since
+    Ray also initializes itself on the first .remote() call and other code
+    may call ray.init() directly.
+
+    Args:
+        force_refresh: Ask Ray directly instead of using the cached state
+
+    Returns:
+        True if Ray is initialized
+    """
+    if force_refresh or not _ray_state["initialized"]:
+        _ray_state["initialized"] = ray.is_initialized()
+    return _ray_state["initialized"]
+
+
+@_ttl_cache(CLUSTER_INFO_TTL_SECONDS)
+def _cluster_snapshot() -> Dict[str, Any]:
+    """Query node and resource state from the GCS (cached briefly)."""
+    return {
+        "nodes": len(ray.nodes()),
+        "available_resources": ray.available_resources(),
+        "cluster_resources": ray.cluster_resources(),
+    }
+
 
 def init_ray(
     address: Optional[str] = None,
@@ -15,6 +94,9 @@ def init_ray(
     num_gpus: Optional[int] = None,
     dashboard_host: str = "0.0.0.0",
     dashboard_port: int = 8265,
+    include_dashboard: Optional[bool] = None,
+    object_store_memory: Optional[int] = None,
+    disable_object_spilling: bool = False,
 ) -> None:
     """
     Initialize Ray cluster.
@@ -25,6 +107,15 @@ def init_ray(
         num_gpus: Number of GPUs to use (None for all available)
         dashboard_host: Dashboard host address
         dashboard_port: Dashboard port
+        include_dashboard: Start the dashboard. Defaults to True unless
+            RAY_WORKER_ONLY is set. Skipping it saves the dashboard and
+            metrics-agent startup (seconds per cold start) for headless
+            worker and CI processes, at the cost of the web UI and metrics.
+        object_store_memory: Object store size in bytes for a local cluster
+            (None lets Ray reserve ~30% of host RAM)
+        disable_object_spilling: Keep all objects in memory on a local
+            cluster instead of spilling to disk; only safe when the object
+            store is sized for the whole workload
 
     Examples:
         # Local mode (single machine)
@@ -38,19 +129,28 @@ def init_ray(
 
         # Local with resource limits
         init_ray(num_cpus=4, num_gpus=1)
+
+        # Headless worker or CI process
+        init_ray(include_dashboard=False)
+
+        # Small in-memory object store for job-tracker sized payloads
+        init_ray(object_store_memory=256 * 1024**2, disable_object_spilling=True)
     """
-    if ray.is_initialized():
+    if is_ray_initialized(force_refresh=True):
         logger.warning("ray_already_initialized")
         return
 
     # Get configuration from environment
     ray_address = address or os.getenv("RAY_ADDRESS")
+    if include_dashboard is None:
+        include_dashboard = not os.getenv("RAY_WORKER_ONLY")
 
     logger.info(
         "initializing_ray",
         address=ray_address,
         num_cpus=num_cpus,
-        num_gpus=num_gpus
+        num_gpus=num_gpus,
+        include_dashboard=include_dashboard
     )
 
     try:
@@ -60,25 +160,36 @@ def init_ray(
                 address=ray_address,
                 dashboard_host=dashboard_host,
                 dashboard_port=dashboard_port,
+                include_dashboard=include_dashboard,
                 logging_level="INFO",
                 namespace="evo_ai",
             )
         else:
             # Start local cluster
+            system_config = (
+                {"automatic_object_spilling_enabled": False}
+                if disable_object_spilling else None
+            )
             ray.init(
                 num_cpus=num_cpus,
                 num_gpus=num_gpus,
                 dashboard_host=dashboard_host,
                 dashboard_port=dashboard_port,
+                include_dashboard=include_dashboard,
                 logging_level="INFO",
                 namespace="evo_ai",
+                object_store_memory=object_store_memory,
                 _temp_dir="/tmp/ray",  # Explicit temp dir
+                _system_config=system_config,
             )
 
+        _ray_state["initialized"] = True
+        _cluster_snapshot.cache_clear()
+        snapshot = _cluster_snapshot()
         logger.info(
             "ray_initialized",
-            nodes=len(ray.nodes()),
-            resources=ray.available_resources()
+            nodes=snapshot["nodes"],
+            resources=snapshot["available_resources"]
         )
 
     except Exception as e:
@@ -88,7 +199,7 @@ def init_ray(
 
 def shutdown_ray() -> None:
     """Shutdown Ray cluster."""
-    if not ray.is_initialized():
+    if not is_ray_initialized(force_refresh=True):
         logger.warning("ray_not_initialized")
         return
 
@@ -96,27 +207,30 @@ def shutdown_ray() -> None:
 
     try:
         ray.shutdown()
+        _ray_state["initialized"] = False
+        _cluster_snapshot.cache_clear()
         logger.info("ray_shutdown_complete")
     except Exception as e:
         logger.error("ray_shutdown_failed", error=str(e))
 
 
-def get_cluster_info() -> dict:
+def get_cluster_info(force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get Ray cluster information.
 
+    Node and resource counts may be up to CLUSTER_INFO_TTL_SECONDS old, so
+    frequent health polls cost at most one GCS round trip per interval.
+
+    Args:
+        force_refresh: Recheck ray.is_initialized() instead of the cached state
+
     Returns:
         Dictionary with cluster details
     """
-    if not ray.is_initialized():
+    if not is_ray_initialized(force_refresh):
         return {
             "initialized": False,
             "error": "Ray not initialized"
         }
 
-    return {
-        "initialized": True,
-        "nodes": len(ray.nodes()),
-        "available_resources": ray.available_resources(),
-        "cluster_resources": ray.cluster_resources(),
-    }
+    return {"initialized": True, **_cluster_snapshot()}
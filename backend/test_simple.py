@@ -3,32 +3,54 @@ Simple test server to verify setup.
 Run this first before the full Evo-AI backend.
 """
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+
+
+async def _tick(app: FastAPI):
+    """Refresh the shared timestamp string once per second."""
+    while True:
+        app.state.now_iso = datetime.utcnow().isoformat()
+        await asyncio.sleep(1)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the timestamp ticker for the lifetime of the server."""
+    app.state.now_iso = datetime.utcnow().isoformat()
+    ticker = asyncio.create_task(_tick(app))
+    yield
+    ticker.cancel()
+
+
 app = FastAPI(
     title="Evo-AI Test Server",
     description="Simple test to verify FastAPI is working",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint."""
     return {
         "message": "Evo-AI Backend is running!",
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": request.app.state.now_iso
     }
 
 @app.get("/health")
-async def health():
+async def health(request: Request):
     """Health check endpoint."""
     return {
         "status": "healthy",
         "service": "evo-ai-test",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": request.app.state.now_iso
     }
 
 @app.get("/test")
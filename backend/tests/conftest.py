@@ -1,28 +1,46 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from typing import AsyncGenerator, Generator
+import functools
+from typing import AsyncGenerator
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlmodel import SQLModel
 
 from evo_ai.config import Settings
 
 
-# Test database URL (uses in-memory SQLite for speed)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL: a named shared-cache in-memory SQLite DB, so every
+# connection sees the same schema without touching disk
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:evoai_test?mode=memory&cache=shared&uri=true"
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_addoption(parser) -> None:
+    """Add the --runslow flag."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
 
 
-@pytest.fixture(scope="session")
+def pytest_collection_modifyitems(config, items) -> None:
+    """
+    Run every async test on the session event loop shared with fixtures,
+    and skip slow tests unless --runslow is given.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    run_slow = config.getoption("--runslow")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def engine():
     """Create async engine for tests."""
     test_engine = create_async_engine(
@@ -31,6 +49,20 @@ async def engine():
         future=True,
     )
 
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN itself so nested transactions work
+    @event.listens_for(test_engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # SQLite frees a shared-cache memory DB when its last connection closes,
+    # so pin one connection for the whole session
+    keeper = await test_engine.connect()
+
     # Create all tables
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -41,21 +73,58 @@ async def engine():
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
 
+    await keeper.close()
     await test_engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def session(engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh database session for each test."""
-    async_session = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """
+    Create a database session whose changes are rolled back after each test.
+
+    The test runs inside one outer transaction; session commits only release
+    a SAVEPOINT, so nothing escapes to later tests.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await transaction.rollback()
+
 
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+@functools.lru_cache(maxsize=1)
+def _cached_app():
+    """Build the FastAPI app once per process (imported lazily)."""
+    from evo_ai.api.app import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Provide the shared FastAPI application."""
+    return _cached_app()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create one API test client for the session (endpoints under test are read-only)."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client) -> dict:
+    """Fetch and parse the OpenAPI schema once per session."""
+    response = client.get("/api/openapi.json")
+    assert response.status_code == 200
+    return response.json()
 
 
 @pytest.fixture
@@ -13,14 +13,17 @@ from evo_ai.agents.base import AgentContext
 from evo_ai.mcp.registry import MCPRegistry
 from evo_ai.domain.models import Campaign, Round
 
+# Keep this module on one xdist worker (-n auto --dist=loadgroup) so the
+# module-scoped registry is built once while other modules run in parallel
+pytestmark = pytest.mark.xdist_group("planner")
 
-@pytest.fixture
-async def mcp_registry():
-    """Create test MCP registry."""
+
+@pytest.fixture(scope="module")
+def mcp_registry():
+    """Create one test MCP registry shared by the module."""
     registry = MCPRegistry()
-    # Register test MCP servers
     yield registry
-    await registry.cleanup()
+    registry.reset()
 
 
 @pytest.fixture
@@ -41,7 +44,8 @@ def campaign():
 
 @pytest.fixture
 async def planner_agent(mcp_registry):
-    """Create PlannerAgent instance."""
+    """Create PlannerAgent instance on a freshly reset registry."""
+    mcp_registry.reset()
     return PlannerAgent(mcp_registry)
 
 
@@ -216,7 +220,3 @@ class TestPlannerAgentErrorHandling:
 
         with pytest.raises(KeyError):
             await planner_agent.execute(context, round_number=1)
-
-
-# Pytest configuration
-pytestmark = pytest.mark.asyncio
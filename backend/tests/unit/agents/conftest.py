@@ -0,0 +1,99 @@
+"""Shared fixtures for agent tests."""
+
+import os
+from dataclasses import dataclass
+from functools import cached_property, wraps
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from evo_ai.agents.base import BaseEvoAgent
+from evo_ai.agents.implementations.scorer import ScorerAgent
+from evo_ai.agents.implementations.variant_generator import VariantAgent
+from evo_ai.mcp.registry import MCPRegistry
+
+# Deterministic agent methods memoized when EVO_TEST_MEMOIZE=1
+MEMOIZED_METHODS = {
+    VariantAgent: (
+        "_apply_refactor",
+        "_apply_optimize",
+        "_apply_expand",
+        "_apply_simplify",
+        "_apply_experimental",
+    ),
+    ScorerAgent: (
+        "_evaluate_with_llm",
+        "_evaluate_with_tests",
+        "_evaluate_with_benchmark",
+    ),
+}
+
+
+@dataclass
+class AgentProbe:
+    """Agent wrapper that computes tools and instructions once per session."""
+
+    agent: BaseEvoAgent
+
+    @cached_property
+    def tools(self) -> List[Callable[..., Any]]:
+        """Tools exposed by the agent."""
+        return self.agent.get_tools()
+
+    @cached_property
+    def instructions(self) -> str:
+        """System instructions of the agent."""
+        return self.agent.get_system_instructions()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _memoize(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an async agent method with a per-instance result cache."""
+    cache: Dict[Any, Any] = {}
+
+    @wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        key = (id(self), _freeze(args), _freeze(kwargs))
+        if key not in cache:
+            cache[key] = await method(self, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoize_agent_methods():
+    """
+    Memoize deterministic agent methods for the session.
+
+    Opt-in via EVO_TEST_MEMOIZE=1; production classes are restored afterwards.
+    """
+    if os.getenv("EVO_TEST_MEMOIZE") != "1":
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        for cls, names in MEMOIZED_METHODS.items():
+            for name in names:
+                mp.setattr(cls, name, _memoize(getattr(cls, name)))
+        yield
+
+
+@pytest.fixture(scope="session")
+def mcp_registry():
+    """Create one MCP registry shared by all agent tests (read-only here)."""
+    return MCPRegistry()
+
+
+@pytest.fixture(scope="session")
+def probe(agent):
+    """Wrap the module's parametrized ``agent`` fixture in an AgentProbe."""
+    return AgentProbe(agent)
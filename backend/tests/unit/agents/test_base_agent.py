@@ -9,7 +9,6 @@ from evo_ai.agents.base import (
     AgentContext,
     AgentDecision,
 )
-from evo_ai.mcp.registry import MCPRegistry
 
 
 class MockAgent(BaseEvoAgent):
@@ -51,12 +50,6 @@ class MockAgent(BaseEvoAgent):
         }
 
 
-@pytest.fixture
-def mcp_registry():
-    """Create MCP registry."""
-    return MCPRegistry()
-
-
 @pytest.fixture
 def agent(mcp_registry):
     """Create mock agent."""
@@ -64,13 +57,13 @@ def agent(mcp_registry):
 
 
 @pytest.fixture
-def context():
+def context(uuid_factory):
     """Create agent context."""
     return AgentContext(
-        trace_id=uuid4(),
-        campaign_id=uuid4(),
-        round_id=uuid4(),
-        variant_id=uuid4(),
+        trace_id=next(uuid_factory),
+        campaign_id=next(uuid_factory),
+        round_id=next(uuid_factory),
+        variant_id=next(uuid_factory),
     )
 
 
@@ -91,7 +84,6 @@ def test_tool_registration(agent):
     assert callable(agent._tools["mock_tool"])
 
 
-@pytest.mark.asyncio
 async def test_call_tool(agent, context):
     """Test calling a registered tool."""
     result = await agent._call_tool("mock_tool", context, value=10)
@@ -101,14 +93,12 @@ async def test_call_tool(agent, context):
     assert result["trace_id"] == str(context.trace_id)
 
 
-@pytest.mark.asyncio
 async def test_call_nonexistent_tool(agent, context):
     """Test calling a non-existent tool raises error."""
     with pytest.raises(ValueError, match="Tool 'nonexistent' not registered"):
         await agent._call_tool("nonexistent", context)
 
 
-@pytest.mark.asyncio
 async def test_execute(agent, context):
     """Test agent execution."""
     result = await agent.execute(context, value=100)
@@ -117,7 +107,6 @@ async def test_execute(agent, context):
     assert result["doubled"] == 200
 
 
-@pytest.mark.asyncio
 async def test_run_with_tracing(agent, context):
     """Test agent execution with tracing."""
     result = await agent.run_with_tracing(context, value=50)
@@ -164,10 +153,10 @@ def test_create_domain_tool(agent):
     assert domain_tool.__doc__ == "My test tool"
 
 
-def test_agent_context_creation():
+def test_agent_context_creation(uuid_factory):
     """Test AgentContext creation."""
-    trace_id = uuid4()
-    campaign_id = uuid4()
+    trace_id = next(uuid_factory)
+    campaign_id = next(uuid_factory)
 
     context = AgentContext(
         trace_id=trace_id,
@@ -199,7 +188,6 @@ def test_agent_decision_creation():
     assert decision.metadata["meta"] == "data"
 
 
-@pytest.mark.asyncio
 async def test_decision_logging_creates_record(agent, context):
     """Test that decision logging creates a database record."""
     from unittest.mock import AsyncMock, MagicMock
@@ -241,7 +229,6 @@ async def test_decision_logging_creates_record(agent, context):
     assert call_args.decision_type == "test_decision"
 
 
-@pytest.mark.asyncio
 async def test_run_with_tracing_handles_errors(agent, context):
     """Test that run_with_tracing properly handles errors."""
     class FailingAgent(BaseEvoAgent):
@@ -1,5 +1,8 @@
 """Tests for concrete agent implementations."""
 
+import asyncio
+import re
+
 import pytest
 from uuid import uuid4
 
@@ -12,18 +15,11 @@ from evo_ai.agents import (
     ReporterAgent,
 )
 from evo_ai.domain.models.report import ReportType
-from evo_ai.mcp.registry import MCPRegistry
-
-
-@pytest.fixture
-def mcp_registry():
-    """Create MCP registry."""
-    return MCPRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def context():
-    """Create agent context."""
+    """Create agent context shared by the module."""
     return AgentContext(
         trace_id=uuid4(),
         campaign_id=uuid4(),
@@ -31,76 +27,90 @@ def context():
     )
 
 
-# PlannerAgent Tests
-
-
-def test_planner_agent_type(mcp_registry):
-    """Test PlannerAgent type."""
-    agent = PlannerAgent(mcp_registry)
-    assert agent.agent_type == "planner"
-
-
-def test_planner_system_instructions(mcp_registry):
-    """Test PlannerAgent system instructions."""
-    agent = PlannerAgent(mcp_registry)
-    instructions = agent.get_system_instructions()
-    assert "PlannerAgent" in instructions
-    assert "experiment rounds" in instructions.lower()
-
-
-def test_planner_tools(mcp_registry):
-    """Test PlannerAgent tools."""
-    agent = PlannerAgent(mcp_registry)
-    tools = agent.get_tools()
-    assert len(tools) > 0
-    # Tools should include campaign queries
-    tool_names = [t.__name__ for t in tools]
-    assert "get_campaign" in tool_names
+AGENT_CLASSES = [PlannerAgent, VariantAgent, ScorerAgent, PolicyAgent, ReporterAgent]
+
+# Expected agent_type, instructions pattern and tool names per class. Each
+# pattern is a set of lookaheads, so the phrases may appear in any order.
+AGENT_EXPECTATIONS = {
+    PlannerAgent: (
+        "planner",
+        re.compile(r"(?=.*PlannerAgent)(?=.*(?i:experiment rounds))", re.S),
+        frozenset({"get_campaign"}),
+    ),
+    VariantAgent: (
+        "variant_generator",
+        re.compile(r"(?=.*VariantAgent)(?=.*(?i:mutation))(?=.*(?i:lineage))", re.S),
+        frozenset({"get_variant", "get_lineage"}),
+    ),
+    ScorerAgent: (
+        "scorer",
+        re.compile(r"(?=.*ScorerAgent)(?=.*(?i:evaluate))", re.S),
+        frozenset({"get_variant", "create_evaluation"}),
+    ),
+    PolicyAgent: (
+        "policy_maker",
+        re.compile(r"(?=.*PolicyAgent)(?=.*(?i:selection))", re.S),
+        frozenset({"get_round_variants"}),
+    ),
+    ReporterAgent: (
+        "reporter",
+        re.compile(r"(?=.*ReporterAgent)(?=.*(?i:report))", re.S),
+        frozenset({"get_campaign", "get_campaign_rounds"}),
+    ),
+}
+
+
+@pytest.fixture(scope="session", params=AGENT_CLASSES, ids=lambda cls: cls.__name__)
+def agent(request, mcp_registry):
+    """Create one instance of each agent class."""
+    return request.param(mcp_registry)
+
+
+@pytest.fixture(scope="session")
+def all_agents(mcp_registry):
+    """Create one instance of every agent class, keyed by class."""
+    return {cls: cls(mcp_registry) for cls in AGENT_CLASSES}
+
+
+def test_agent_type(agent):
+    """Test each agent's type identifier."""
+    expected_type, _, _ = AGENT_EXPECTATIONS[type(agent)]
+    assert agent.agent_type == expected_type
+
+
+def test_system_instructions(probe):
+    """Test each agent's system instructions."""
+    _, pattern, _ = AGENT_EXPECTATIONS[type(probe.agent)]
+    assert pattern.match(probe.instructions)
+
+
+def test_tools(probe):
+    """Test each agent exposes its expected tools."""
+    _, _, expected_tools = AGENT_EXPECTATIONS[type(probe.agent)]
+    assert len(probe.tools) > 0
+    tool_names = {t.__name__ for t in probe.tools}
+    assert expected_tools <= tool_names
 
 
 # VariantAgent Tests
 
 
-def test_variant_agent_type(mcp_registry):
-    """Test VariantAgent type."""
-    agent = VariantAgent(mcp_registry)
-    assert agent.agent_type == "variant_generator"
-
-
-def test_variant_system_instructions(mcp_registry):
-    """Test VariantAgent system instructions."""
-    agent = VariantAgent(mcp_registry)
-    instructions = agent.get_system_instructions()
-    assert "VariantAgent" in instructions
-    assert "mutation" in instructions.lower()
-    assert "lineage" in instructions.lower()
-
-
-def test_variant_tools(mcp_registry):
-    """Test VariantAgent tools."""
-    agent = VariantAgent(mcp_registry)
-    tools = agent.get_tools()
-    assert len(tools) > 0
-    tool_names = [t.__name__ for t in tools]
-    assert "get_variant" in tool_names
-    assert "get_lineage" in tool_names
-
-
-@pytest.mark.asyncio
-async def test_variant_mutation_types(mcp_registry):
+async def test_variant_mutation_types(all_agents):
     """Test that VariantAgent supports all mutation types."""
-    agent = VariantAgent(mcp_registry)
+    agent = all_agents[VariantAgent]
 
     mutation_types = ["refactor", "optimize", "expand", "simplify", "experimental"]
 
+    # Each mutation method must exist; the calls are independent, so run them together
     for mutation_type in mutation_types:
-        # Test each mutation method exists
-        method_name = f"_apply_{mutation_type}"
-        assert hasattr(agent, method_name)
-        method = getattr(agent, method_name)
+        assert hasattr(agent, f"_apply_{mutation_type}")
+    results = await asyncio.gather(*(
+        getattr(agent, f"_apply_{mutation_type}")("test content", {"generations": 1}, {})
+        for mutation_type in mutation_types
+    ))
 
+    for result in results:
         # Test method signature
-        result = await method("test content", {"generations": 1}, {})
         assert isinstance(result, tuple)
         assert len(result) == 2  # (new_content, reasoning)
         assert isinstance(result[0], str)  # new_content
@@ -110,41 +120,22 @@ async def test_variant_mutation_types(mcp_registry):
 # ScorerAgent Tests
 
 
-def test_scorer_agent_type(mcp_registry):
-    """Test ScorerAgent type."""
-    agent = ScorerAgent(mcp_registry)
-    assert agent.agent_type == "scorer"
-
-
-def test_scorer_system_instructions(mcp_registry):
-    """Test ScorerAgent system instructions."""
-    agent = ScorerAgent(mcp_registry)
-    instructions = agent.get_system_instructions()
-    assert "ScorerAgent" in instructions
-    assert "evaluate" in instructions.lower()
-
-
-def test_scorer_tools(mcp_registry):
-    """Test ScorerAgent tools."""
-    agent = ScorerAgent(mcp_registry)
-    tools = agent.get_tools()
-    assert len(tools) > 0
-    tool_names = [t.__name__ for t in tools]
-    assert "get_variant" in tool_names
-    assert "create_evaluation" in tool_names
-
-
-@pytest.mark.asyncio
-async def test_scorer_evaluation_methods(mcp_registry):
+async def test_scorer_evaluation_methods(all_agents):
     """Test ScorerAgent evaluation methods."""
-    agent = ScorerAgent(mcp_registry)
+    agent = all_agents[ScorerAgent]
 
     variant = {"content": "test", "generation": 1}
     lineage = {"generations": 1}
     config = {}
 
+    llm, tests, benchmark = await asyncio.gather(
+        agent._evaluate_with_llm(variant, lineage, config),
+        agent._evaluate_with_tests(variant, lineage, config),
+        agent._evaluate_with_benchmark(variant, lineage, config),
+    )
+
     # Test LLM evaluation
-    score, feedback, criteria = await agent._evaluate_with_llm(variant, lineage, config)
+    score, feedback, criteria = llm
     assert isinstance(score, float)
     assert 0.0 <= score <= 1.0
     assert isinstance(feedback, str)
@@ -152,13 +143,13 @@ async def test_scorer_evaluation_methods(mcp_registry):
     assert "correctness" in criteria
 
     # Test unit test evaluation
-    score, feedback, criteria = await agent._evaluate_with_tests(variant, lineage, config)
+    score, feedback, criteria = tests
     assert isinstance(score, float)
     assert isinstance(feedback, str)
     assert "tests_passed" in criteria
 
     # Test benchmark evaluation
-    score, feedback, criteria = await agent._evaluate_with_benchmark(variant, lineage, config)
+    score, feedback, criteria = benchmark
     assert isinstance(score, float)
     assert isinstance(feedback, str)
     assert "throughput" in criteria
@@ -167,32 +158,9 @@ async def test_scorer_evaluation_methods(mcp_registry):
 # PolicyAgent Tests
 
 
-def test_policy_agent_type(mcp_registry):
-    """Test PolicyAgent type."""
-    agent = PolicyAgent(mcp_registry)
-    assert agent.agent_type == "policy_maker"
-
-
-def test_policy_system_instructions(mcp_registry):
-    """Test PolicyAgent system instructions."""
-    agent = PolicyAgent(mcp_registry)
-    instructions = agent.get_system_instructions()
-    assert "PolicyAgent" in instructions
-    assert "selection" in instructions.lower()
-
-
-def test_policy_tools(mcp_registry):
-    """Test PolicyAgent tools."""
-    agent = PolicyAgent(mcp_registry)
-    tools = agent.get_tools()
-    assert len(tools) > 0
-    tool_names = [t.__name__ for t in tools]
-    assert "get_round_variants" in tool_names
-
-
-def test_policy_creation_methods(mcp_registry):
+def test_policy_creation_methods(all_agents):
     """Test PolicyAgent policy creation methods."""
-    agent = PolicyAgent(mcp_registry)
+    agent = all_agents[PolicyAgent]
 
     # Test top-K policy
     rules, params = agent._create_top_k_policy(k=5)
@@ -211,79 +179,28 @@ def test_policy_creation_methods(mcp_registry):
     assert params["count"] == 10
 
 
-# ReporterAgent Tests
-
-
-def test_reporter_agent_type(mcp_registry):
-    """Test ReporterAgent type."""
-    agent = ReporterAgent(mcp_registry)
-    assert agent.agent_type == "reporter"
-
-
-def test_reporter_system_instructions(mcp_registry):
-    """Test ReporterAgent system instructions."""
-    agent = ReporterAgent(mcp_registry)
-    instructions = agent.get_system_instructions()
-    assert "ReporterAgent" in instructions
-    assert "report" in instructions.lower()
-
-
-def test_reporter_tools(mcp_registry):
-    """Test ReporterAgent tools."""
-    agent = ReporterAgent(mcp_registry)
-    tools = agent.get_tools()
-    assert len(tools) > 0
-    tool_names = [t.__name__ for t in tools]
-    assert "get_campaign" in tool_names
-    assert "get_campaign_rounds" in tool_names
-
-
 # Integration Tests
 
 
-@pytest.mark.asyncio
-async def test_agent_swarm_conversion(mcp_registry):
+@pytest.mark.slow
+async def test_agent_swarm_conversion(all_agents):
     """Test that all agents can be converted to Swarm agents."""
-    agents = [
-        PlannerAgent(mcp_registry),
-        VariantAgent(mcp_registry),
-        ScorerAgent(mcp_registry),
-        PolicyAgent(mcp_registry),
-        ReporterAgent(mcp_registry),
-    ]
-
-    for agent in agents:
+    for agent in all_agents.values():
         swarm_agent = agent.to_swarm_agent()
         assert swarm_agent.name == agent.agent_type
         assert swarm_agent.instructions == agent.get_system_instructions()
         assert len(swarm_agent.functions) > 0
 
 
-def test_all_agents_have_unique_types(mcp_registry):
+def test_all_agents_have_unique_types(all_agents):
     """Test that all agents have unique type identifiers."""
-    agents = [
-        PlannerAgent(mcp_registry),
-        VariantAgent(mcp_registry),
-        ScorerAgent(mcp_registry),
-        PolicyAgent(mcp_registry),
-        ReporterAgent(mcp_registry),
-    ]
-
-    agent_types = [agent.agent_type for agent in agents]
+    agent_types = [agent.agent_type for agent in all_agents.values()]
     assert len(agent_types) == len(set(agent_types))  # All unique
 
 
-def test_all_agents_inherit_from_base(mcp_registry):
+def test_all_agents_inherit_from_base(all_agents):
     """Test that all agents inherit from BaseEvoAgent."""
     from evo_ai.agents.base import BaseEvoAgent
 
-    agents = [
-        PlannerAgent(mcp_registry),
-        VariantAgent(mcp_registry),
-        ScorerAgent(mcp_registry),
-        PolicyAgent(mcp_registry),
-        ReporterAgent(mcp_registry),
-    ]
-
-    for agent in agents:
+    for agent in all_agents.values():
         assert isinstance(agent, BaseEvoAgent)
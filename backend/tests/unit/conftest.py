@@ -0,0 +1,32 @@
+"""Pytest configuration for unit tests."""
+
+from typing import Iterator
+from uuid import UUID, uuid4
+
+import pytest
+
+# IDs for tests that only need uniqueness, generated once per session
+_UUID_POOL = [uuid4() for _ in range(256)]
+
+# Session fixtures mapped to the xdist group of the tests that share them,
+# so `pytest -n auto --dist=loadgroup` builds each one on a single worker
+_XDIST_GROUPS = {
+    "mcp_registry": "agents",
+    "client": "api",
+    "session_tracker": "tasks",
+}
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Group tests by the session fixture they share."""
+    for item in items:
+        for fixture, group in _XDIST_GROUPS.items():
+            if fixture in item.fixturenames:
+                item.add_marker(pytest.mark.xdist_group(group))
+                break
+
+
+@pytest.fixture
+def uuid_factory() -> Iterator[UUID]:
+    """Yield distinct pre-generated UUIDs for one test."""
+    return iter(_UUID_POOL)
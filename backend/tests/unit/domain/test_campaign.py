@@ -1,9 +1,19 @@
 """Unit tests for Campaign domain model."""
 
+from types import MappingProxyType
+
 import pytest
 
 from evo_ai.domain.models.campaign import Campaign, CampaignStatus
 
+# Read-only; Campaign validation copies it into a fresh dict per instance
+_DEFAULT_CONFIG = MappingProxyType({"population_size": 10})
+
+
+def _make_campaign(name: str = "Test Campaign") -> Campaign:
+    """Build a draft campaign with the default config."""
+    return Campaign(name=name, config=_DEFAULT_CONFIG)
+
 
 class TestCampaign:
     """Test cases for Campaign entity."""
@@ -21,105 +31,50 @@ class TestCampaign:
         assert campaign.config["population_size"] == 10
         assert campaign.deleted_at is None
 
-    def test_activate_campaign(self):
-        """Test activating a draft campaign."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-
+    def test_full_lifecycle(self):
+        """Test draft -> active -> paused -> active -> completed on one campaign."""
+        campaign = _make_campaign()
         assert campaign.status == CampaignStatus.DRAFT
 
-        campaign.activate()
-
-        assert campaign.status == CampaignStatus.ACTIVE
-
-    def test_cannot_activate_non_draft_campaign(self):
-        """Test that non-draft campaigns cannot be activated."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-        campaign.activate()
-
-        with pytest.raises(ValueError, match="Cannot activate"):
-            campaign.activate()
-
-    def test_pause_active_campaign(self):
-        """Test pausing an active campaign."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-        campaign.activate()
-
-        campaign.pause()
-
-        assert campaign.status == CampaignStatus.PAUSED
-
-    def test_cannot_pause_non_active_campaign(self):
-        """Test that only active campaigns can be paused."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-
-        with pytest.raises(ValueError, match="Cannot pause"):
-            campaign.pause()
-
-    def test_resume_paused_campaign(self):
-        """Test resuming a paused campaign."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-        campaign.activate()
-        campaign.pause()
-
-        campaign.resume()
-
-        assert campaign.status == CampaignStatus.ACTIVE
-
-    def test_cannot_resume_non_paused_campaign(self):
-        """Test that only paused campaigns can be resumed."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-
-        with pytest.raises(ValueError, match="Cannot resume"):
-            campaign.resume()
-
-    def test_complete_campaign(self):
-        """Test completing a campaign."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
-        campaign.activate()
-
-        campaign.complete()
-
-        assert campaign.status == CampaignStatus.COMPLETED
+        for action, expected in (
+            ("activate", CampaignStatus.ACTIVE),
+            ("pause", CampaignStatus.PAUSED),
+            ("resume", CampaignStatus.ACTIVE),
+            ("complete", CampaignStatus.COMPLETED),
+        ):
+            getattr(campaign, action)()
+            assert campaign.status == expected
 
     def test_fail_campaign(self):
-        """Test marking campaign as failed."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
+        """Test marking an active campaign as failed."""
+        campaign = _make_campaign()
         campaign.activate()
 
         campaign.fail()
 
         assert campaign.status == CampaignStatus.FAILED
 
+    @pytest.mark.parametrize(
+        ("setup", "action", "message"),
+        [
+            (["activate"], "activate", "Cannot activate"),
+            ([], "pause", "Cannot pause"),
+            ([], "resume", "Cannot resume"),
+        ],
+        ids=["activate-non-draft", "pause-non-active", "resume-non-paused"],
+    )
+    def test_invalid_transitions(self, setup, action, message):
+        """Test rejection of illegal status transitions."""
+        campaign = _make_campaign()
+        for step in setup:
+            getattr(campaign, step)()
+
+        with pytest.raises(ValueError, match=message):
+            getattr(campaign, action)()
+
     def test_soft_delete(self):
         """Test soft deletion of campaign."""
-        campaign = Campaign(
-            name="Test Campaign",
-            config={"population_size": 10}
-        )
+        campaign = _make_campaign()
 
         assert campaign.deleted_at is None
 
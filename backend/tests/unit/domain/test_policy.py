@@ -1,16 +1,14 @@
 """Unit tests for Policy domain model."""
 
-from uuid import uuid4
-
 from evo_ai.domain.models.policy import Policy, PolicyType
 
 
 class TestPolicy:
     """Test cases for Policy entity."""
 
-    def test_create_policy(self):
+    def test_create_policy(self, uuid_factory):
         """Test creating a policy."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         policy = Policy(
             campaign_id=campaign_id,
             name="Top-K Selection",
@@ -24,38 +22,24 @@ class TestPolicy:
         assert policy.version == 1
         assert policy.is_active is True
 
-    def test_activate_policy(self):
-        """Test activating a policy."""
-        campaign_id = uuid4()
+    def test_activation_cycle(self, uuid_factory):
+        """Test deactivating and reactivating one policy."""
         policy = Policy(
-            campaign_id=campaign_id,
+            campaign_id=next(uuid_factory),
             name="Test Policy",
             policy_type=PolicyType.SELECTION,
             config={}
         )
+
         policy.deactivate()
+        assert policy.is_active is False
 
         policy.activate()
-
         assert policy.is_active is True
 
-    def test_deactivate_policy(self):
-        """Test deactivating a policy."""
-        campaign_id = uuid4()
-        policy = Policy(
-            campaign_id=campaign_id,
-            name="Test Policy",
-            policy_type=PolicyType.SELECTION,
-            config={}
-        )
-
-        policy.deactivate()
-
-        assert policy.is_active is False
-
-    def test_create_new_version(self):
+    def test_create_new_version(self, uuid_factory):
         """Test creating a new version of a policy."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         policy_v1 = Policy(
             campaign_id=campaign_id,
             name="Test Policy",
@@ -76,9 +60,9 @@ class TestPolicy:
         assert policy_v2.config["new_param"] == "value3"
         assert policy_v2.is_active is True
 
-    def test_policy_types(self):
+    def test_policy_types(self, uuid_factory):
         """Test different policy types."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
 
         selection_policy = Policy(
             campaign_id=campaign_id,
@@ -104,9 +88,9 @@ class TestPolicy:
         )
         assert termination_policy.policy_type == PolicyType.TERMINATION
 
-    def test_soft_delete(self):
+    def test_soft_delete(self, uuid_factory):
         """Test soft deletion of policy."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         policy = Policy(
             campaign_id=campaign_id,
             name="Test Policy",
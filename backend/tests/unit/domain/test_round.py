@@ -1,7 +1,5 @@
 """Unit tests for Round domain model."""
 
-from uuid import uuid4
-
 import pytest
 
 from evo_ai.domain.models.round import Round, RoundStatus
@@ -10,9 +8,9 @@ from evo_ai.domain.models.round import Round, RoundStatus
 class TestRound:
     """Test cases for Round entity."""
 
-    def test_create_round(self):
+    def test_create_round(self, uuid_factory):
         """Test creating a round."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         round_obj = Round(
             campaign_id=campaign_id,
             round_number=1
@@ -23,9 +21,9 @@ class TestRound:
         assert round_obj.status == RoundStatus.PENDING
         assert round_obj.plan is None
 
-    def test_round_execution_flow(self):
+    def test_round_execution_flow(self, uuid_factory):
         """Test the complete round execution flow."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         round_obj = Round(campaign_id=campaign_id, round_number=1)
 
         # Start planning
@@ -58,18 +56,18 @@ class TestRound:
         assert round_obj.completed_at is not None
         assert round_obj.metrics["avg_score"] == 0.75
 
-    def test_invalid_state_transition(self):
+    def test_invalid_state_transition(self, uuid_factory):
         """Test that invalid state transitions raise errors."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         round_obj = Round(campaign_id=campaign_id, round_number=1)
 
         # Cannot start generating before planning
         with pytest.raises(ValueError, match="Cannot start generating"):
             round_obj.start_generating({"test": "plan"})
 
-    def test_fail_round(self):
+    def test_fail_round(self, uuid_factory):
         """Test marking round as failed."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         round_obj = Round(campaign_id=campaign_id, round_number=1)
         round_obj.start_planning()
 
@@ -79,9 +77,9 @@ class TestRound:
         assert round_obj.status == RoundStatus.FAILED
         assert round_obj.metrics["error"] == error_info
 
-    def test_soft_delete(self):
+    def test_soft_delete(self, uuid_factory):
         """Test soft deletion of round."""
-        campaign_id = uuid4()
+        campaign_id = next(uuid_factory)
         round_obj = Round(campaign_id=campaign_id, round_number=1)
 
         assert round_obj.deleted_at is None
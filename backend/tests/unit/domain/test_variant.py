@@ -1,18 +1,24 @@
 """Unit tests for Variant domain model."""
 
-from uuid import uuid4
+import hashlib
 
 import pytest
 
 from evo_ai.domain.models.variant import Variant
 
+# Content hashes precomputed once at import
+EXPECTED_HASHES = {
+    content: hashlib.sha256(content.encode("utf-8")).hexdigest()
+    for content in ["Test content", "Identical content", "Content A", "Content B"]
+}
+
 
 class TestVariant:
     """Test cases for Variant entity."""
 
-    def test_create_initial_variant(self):
+    def test_create_initial_variant(self, uuid_factory):
         """Test creating an initial variant (generation 0)."""
-        round_id = uuid4()
+        round_id = next(uuid_factory)
         content = "You are a helpful assistant."
 
         variant = Variant.create_initial(
@@ -29,9 +35,9 @@ class TestVariant:
         assert variant.mutation_metadata == {"source": "manual"}
         assert variant.is_selected is False
 
-    def test_create_from_parent(self):
+    def test_create_from_parent(self, uuid_factory):
         """Test creating a variant from a parent."""
-        round_id = uuid4()
+        round_id = next(uuid_factory)
         parent = Variant.create_initial(
             round_id=round_id,
             content="Original prompt"
@@ -52,9 +58,9 @@ class TestVariant:
         assert child.content == "Modified prompt"
         assert child.mutation_type == "mutation"
 
-    def test_lineage_tracking_multiple_generations(self):
+    def test_lineage_tracking_multiple_generations(self, uuid_factory):
         """Test lineage tracking across multiple generations."""
-        round_id = uuid4()
+        round_id = next(uuid_factory)
 
         # Generation 0
         gen0 = Variant.create_initial(round_id=round_id, content="Gen 0")
@@ -81,34 +87,24 @@ class TestVariant:
         assert gen2.generation == 2
         assert gen2.parent_id == gen1.id
 
-    def test_content_hash_generation(self):
-        """Test that content hash is generated automatically."""
-        variant = Variant.create_initial(
-            round_id=uuid4(),
-            content="Test content"
-        )
+    @pytest.mark.parametrize("content", list(EXPECTED_HASHES))
+    def test_content_hash(self, content, uuid_factory):
+        """Test that content hash is the deterministic SHA-256 of the content."""
+        variant = Variant.create_initial(round_id=next(uuid_factory), content=content)
 
-        assert variant.content_hash is not None
+        assert variant.content_hash == EXPECTED_HASHES[content]
         assert len(variant.content_hash) == 64  # SHA-256 produces 64 hex characters
 
-    def test_content_hash_deterministic(self):
-        """Test that identical content produces identical hash."""
-        content = "Identical content"
-        variant1 = Variant.create_initial(round_id=uuid4(), content=content)
-        variant2 = Variant.create_initial(round_id=uuid4(), content=content)
-
-        assert variant1.content_hash == variant2.content_hash
-
-    def test_content_hash_different_for_different_content(self):
+    def test_content_hash_different_for_different_content(self, uuid_factory):
         """Test that different content produces different hash."""
-        variant1 = Variant.create_initial(round_id=uuid4(), content="Content A")
-        variant2 = Variant.create_initial(round_id=uuid4(), content="Content B")
+        variant1 = Variant.create_initial(round_id=next(uuid_factory), content="Content A")
+        variant2 = Variant.create_initial(round_id=next(uuid_factory), content="Content B")
 
         assert variant1.content_hash != variant2.content_hash
 
-    def test_select_for_next_round(self):
+    def test_select_for_next_round(self, uuid_factory):
         """Test marking variant as selected."""
-        variant = Variant.create_initial(round_id=uuid4(), content="Test")
+        variant = Variant.create_initial(round_id=next(uuid_factory), content="Test")
 
         assert variant.is_selected is False
 
@@ -116,9 +112,9 @@ class TestVariant:
 
         assert variant.is_selected is True
 
-    def test_soft_delete(self):
+    def test_soft_delete(self, uuid_factory):
         """Test soft deletion of variant."""
-        variant = Variant.create_initial(round_id=uuid4(), content="Test")
+        variant = Variant.create_initial(round_id=next(uuid_factory), content="Test")
 
         assert variant.deleted_at is None
 
@@ -0,0 +1,60 @@
+"""Tests for MCP access-log buffering."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from evo_ai.mcp import registry as registry_module
+from evo_ai.mcp.registry import ACCESS_LOG_BATCH_SIZE, MCPRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Registry whose rows are plain namespaces and whose writes always fail."""
+    monkeypatch.setattr(registry_module, "MCPAccessLogDB", SimpleNamespace)
+    registry = MCPRegistry()
+    registry.write_attempts = 0
+
+    async def failing_write(entries):
+        registry.write_attempts += 1
+        raise ConnectionError("database unreachable")
+
+    registry._write_access_logs = failing_write
+    return registry
+
+
+async def _log(registry, count):
+    for _ in range(count):
+        await registry._log_access(
+            trace_id=None,
+            server_name="test",
+            server_version="1.0.0",
+            tool_name="tool",
+            input_params={},
+            output_data={"ok": True},
+            status="success",
+            error_message=None,
+            duration_ms=1,
+        )
+
+
+async def test_failed_flush_requeues_rows(registry):
+    """Rows from a failed size-triggered flush stay buffered."""
+    await _log(registry, ACCESS_LOG_BATCH_SIZE)
+
+    assert registry.write_attempts == 1
+    assert registry._pending_count == ACCESS_LOG_BATCH_SIZE
+
+
+async def test_failed_flush_backs_off_inline_retries(registry, monkeypatch):
+    """After a failed write, further calls don't retry the flush each time."""
+    await _log(registry, ACCESS_LOG_BATCH_SIZE + 50)
+
+    assert registry.write_attempts == 1
+    assert registry._pending_count == ACCESS_LOG_BATCH_SIZE + 50
+
+    # Once the backoff has elapsed the next call retries
+    monkeypatch.setattr(registry, "_next_flush_after", 0.0)
+    await _log(registry, 1)
+
+    assert registry.write_attempts == 2
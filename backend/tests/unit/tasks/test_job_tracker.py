@@ -1,21 +1,39 @@
 """Tests for job tracker."""
 
+import asyncio
+
+import fakeredis
+import orjson
 import pytest
-from uuid import uuid4
 
-from evo_ai.tasks.job_tracker import JobTracker, JobStatus
+import evo_ai.tasks.job_tracker as job_tracker_module
+from evo_ai.tasks.job_tracker import (
+    Job,
+    JobStatus,
+    JobTracker,
+    RedisJobTracker,
+    _JobShard,
+    create_job_tracker,
+)
 
 
-@pytest.fixture
-def tracker():
-    """Create job tracker."""
+@pytest.fixture(scope="session")
+def session_tracker():
+    """Create one job tracker for the session."""
     return JobTracker()
 
 
-def test_create_job(tracker):
+@pytest.fixture
+def tracker(session_tracker):
+    """Provide the shared job tracker, emptied for this test."""
+    session_tracker.reset()
+    return session_tracker
+
+
+def test_create_job(tracker, uuid_factory):
     """Test job creation."""
-    campaign_id = uuid4()
-    trace_id = uuid4()
+    campaign_id = next(uuid_factory)
+    trace_id = next(uuid_factory)
 
     job = tracker.create_job(
         task_type="execute_round",
@@ -43,9 +61,9 @@ def test_get_job(tracker):
     assert retrieved.task_type == "test"
 
 
-def test_get_nonexistent_job(tracker):
+def test_get_nonexistent_job(tracker, uuid_factory):
     """Test getting non-existent job."""
-    job = tracker.get_job(uuid4())
+    job = tracker.get_job(next(uuid_factory))
     assert job is None
 
 
@@ -99,27 +117,28 @@ def test_update_status_to_failed(tracker):
     assert updated.completed_at is not None
 
 
-def test_list_jobs(tracker):
+def test_list_jobs(tracker, uuid_factory):
     """Test listing jobs."""
-    campaign_id = uuid4()
+    campaign_id = next(uuid_factory)
 
     # Create jobs
     job1 = tracker.create_job(task_type="test1", campaign_id=campaign_id)
-    job2 = tracker.create_job(task_type="test2", campaign_id=campaign_id)
-    job3 = tracker.create_job(task_type="test3", campaign_id=uuid4())
+    tracker.create_job(task_type="test2", campaign_id=campaign_id)
+    tracker.create_job(task_type="test3", campaign_id=next(uuid_factory))
+
+    tracker.update_status(job1.job_id, JobStatus.COMPLETED)
 
-    # List all
+    # Materialize once; filtered listings must return the same jobs
     all_jobs = tracker.list_jobs()
     assert len(all_jobs) == 3
 
-    # List by campaign
-    campaign_jobs = tracker.list_jobs(campaign_id=campaign_id)
-    assert len(campaign_jobs) == 2
+    by_campaign = {j.job_id for j in all_jobs if j.campaign_id == campaign_id}
+    by_status = {j.job_id for j in all_jobs if j.status == JobStatus.COMPLETED}
+    assert len(by_campaign) == 2
+    assert len(by_status) == 1
 
-    # Update status and list by status
-    tracker.update_status(job1.job_id, JobStatus.COMPLETED)
-    completed = tracker.list_jobs(status=JobStatus.COMPLETED)
-    assert len(completed) == 1
+    assert {j.job_id for j in tracker.list_jobs(campaign_id=campaign_id)} == by_campaign
+    assert {j.job_id for j in tracker.list_jobs(status=JobStatus.COMPLETED)} == by_status
 
 
 def test_delete_job(tracker):
@@ -133,9 +152,9 @@ def test_delete_job(tracker):
     assert retrieved is None
 
 
-def test_delete_nonexistent_job(tracker):
+def test_delete_nonexistent_job(tracker, uuid_factory):
     """Test deleting non-existent job."""
-    deleted = tracker.delete_job(uuid4())
+    deleted = tracker.delete_job(next(uuid_factory))
     assert deleted is False
 
 
@@ -172,3 +191,299 @@ def test_progress_clamping(tracker):
     tracker.update_status(job.job_id, JobStatus.RUNNING, progress=-0.5)
     updated = tracker.get_job(job.job_id)
     assert updated.progress == 0.0
+
+
+def test_list_jobs_combined_filters(tracker, uuid_factory):
+    """Test filtering by campaign and status together."""
+    campaign_id = next(uuid_factory)
+
+    job1 = tracker.create_job(task_type="test1", campaign_id=campaign_id)
+    tracker.create_job(task_type="test2", campaign_id=campaign_id)
+    other = tracker.create_job(task_type="test3", campaign_id=next(uuid_factory))
+
+    tracker.update_status(job1.job_id, JobStatus.RUNNING)
+    tracker.update_status(other.job_id, JobStatus.RUNNING)
+
+    running = tracker.list_jobs(campaign_id=campaign_id, status=JobStatus.RUNNING)
+    assert [j.job_id for j in running] == [job1.job_id]
+
+    pending = tracker.list_jobs(status=JobStatus.PENDING)
+    assert len(pending) == 1
+
+    # Deleted jobs drop out of filtered listings
+    tracker.delete_job(job1.job_id)
+    assert tracker.list_jobs(campaign_id=campaign_id, status=JobStatus.RUNNING) == []
+
+
+def test_cleanup_old_jobs(tracker):
+    """Test that only finished jobs past the cutoff are removed."""
+    finished = tracker.create_job(task_type="test")
+    running = tracker.create_job(task_type="test")
+
+    tracker.update_status(finished.job_id, JobStatus.COMPLETED)
+    tracker.update_status(running.job_id, JobStatus.RUNNING)
+
+    # Nothing is old enough yet
+    assert tracker.cleanup_old_jobs(max_age_hours=24) == 0
+
+    # Negative age puts the cutoff in the future
+    assert tracker.cleanup_old_jobs(max_age_hours=-1) == 1
+    assert tracker.get_job(finished.job_id) is None
+    assert tracker.get_job(running.job_id) is not None
+    assert tracker.list_jobs(status=JobStatus.COMPLETED) == []
+
+
+def test_job_to_dict(tracker, uuid_factory):
+    """Test API serialization of a job."""
+    campaign_id = next(uuid_factory)
+    job = tracker.create_job(task_type="test", campaign_id=campaign_id, round_number=2)
+    tracker.update_status(job.job_id, JobStatus.COMPLETED, result={"ok": True})
+
+    data = job.to_dict()
+
+    assert data["job_id"] == str(job.job_id)
+    assert data["campaign_id"] == str(campaign_id)
+    assert data["status"] == "completed"
+    assert data["round_number"] == 2
+    assert data["result"] == {"ok": True}
+    assert data["started_at"] is None
+    assert data["completed_at"] == job.completed_at.isoformat()
+
+
+def test_deleted_slot_reuse(tracker):
+    """Test that a reused internal slot never resolves to the deleted job."""
+    old = tracker.create_job(task_type="old")
+    tracker.update_status(old.job_id, JobStatus.COMPLETED)
+    tracker.delete_job(old.job_id)
+
+    new = tracker.create_job(task_type="new")
+
+    assert tracker.get_job(old.job_id) is None
+    assert tracker.get_job(new.job_id) is new
+
+    # The stale completion entry for the old job must not expire the new one
+    assert tracker.cleanup_old_jobs(max_age_hours=-1) == 0
+    assert tracker.get_job(new.job_id) is new
+
+
+def test_get_with_stale_slot_lookup():
+    """Test an unlocked read racing a delete and slot reuse never returns another job."""
+    shard = _JobShard()
+    old = Job(task_type="old")
+    shard.add(old)
+    slot = shard.slot_of[old.job_id]
+
+    shard.delete(old.job_id)
+    new = Job(task_type="new")
+    shard.add(new)
+    assert shard.slot_of[new.job_id] == slot
+
+    # A reader that resolved the slot before the delete sees the reused slot
+    shard.slot_of[old.job_id] = slot
+    assert shard.get(old.job_id) is None
+    assert shard.get(new.job_id) is new
+
+
+def test_ttl_expiry_with_attached_loop():
+    """Test finished jobs are expired by timers on the attached loop."""
+    tracker = JobTracker(ttl_seconds=0.01)
+
+    async def run():
+        tracker.attach_loop(asyncio.get_running_loop())
+        done = tracker.create_job(task_type="test")
+        running = tracker.create_job(task_type="test")
+        tracker.update_status(done.job_id, JobStatus.COMPLETED)
+        tracker.update_status(running.job_id, JobStatus.RUNNING)
+
+        await asyncio.sleep(0.05)
+        return done, running
+
+    done, running = asyncio.run(run())
+
+    assert tracker.get_job(done.job_id) is None
+    assert tracker.get_job(running.job_id) is not None
+    # Timer expiry also drops the completion heap entry
+    assert all(not shard.by_completed for shard in tracker._shards)
+
+
+def test_job_to_json(tracker):
+    """Test JSON serialization embeds the encoded result."""
+    job = tracker.create_job(task_type="test")
+    tracker.update_status(job.job_id, JobStatus.COMPLETED, result={"score": 0.9})
+
+    data = orjson.loads(job.to_json())
+
+    assert data == orjson.loads(orjson.dumps(job.to_dict()))
+    assert data["result"] == {"score": 0.9}
+
+
+@pytest.fixture
+def redis_server():
+    """Create an isolated in-process Redis server."""
+    return fakeredis.FakeServer()
+
+
+def _redis_tracker(server):
+    return RedisJobTracker(fakeredis.FakeRedis(server=server, decode_responses=True))
+
+
+@pytest.fixture
+def redis_tracker(redis_server):
+    """Create a Redis job tracker on the fake server."""
+    return _redis_tracker(redis_server)
+
+
+def _status_sets(tracker, job_id):
+    """Return the statuses whose index set holds the job ID."""
+    return {
+        status for status in JobStatus
+        if tracker._redis.sismember(tracker._status_key(status), str(job_id))
+    }
+
+
+def test_redis_create_and_get(redis_tracker, uuid_factory):
+    """Test a created job round-trips and is indexed."""
+    campaign_id = next(uuid_factory)
+    job = redis_tracker.create_job(task_type="execute_round", campaign_id=campaign_id, round_number=3)
+
+    retrieved = redis_tracker.get_job(job.job_id)
+
+    assert retrieved == job
+    assert _status_sets(redis_tracker, job.job_id) == {JobStatus.PENDING}
+    assert redis_tracker._redis.sismember(redis_tracker._campaign_key(campaign_id), str(job.job_id))
+
+
+def test_redis_update_status(redis_tracker):
+    """Test status updates move the job between index sets."""
+    job = redis_tracker.create_job(task_type="test")
+
+    redis_tracker.update_status(job.job_id, JobStatus.RUNNING, progress=0.5)
+    updated = redis_tracker.update_status(job.job_id, JobStatus.COMPLETED, result={"ok": True})
+
+    retrieved = redis_tracker.get_job(job.job_id)
+    assert retrieved.status == JobStatus.COMPLETED
+    assert retrieved.progress == 0.5
+    assert retrieved.result == {"ok": True}
+    assert retrieved.completed_ts == updated.completed_ts
+    assert _status_sets(redis_tracker, job.job_id) == {JobStatus.COMPLETED}
+    assert redis_tracker._redis.zscore(redis_tracker._completed_key, str(job.job_id)) == updated.completed_ts
+
+
+def test_redis_update_missing_job(redis_tracker, uuid_factory):
+    """Test updating an unknown job writes nothing."""
+    job_id = next(uuid_factory)
+
+    assert redis_tracker.update_status(job_id, JobStatus.RUNNING) is None
+    assert not redis_tracker._redis.exists(redis_tracker._job_key(job_id))
+
+
+def test_redis_list_jobs(redis_tracker, uuid_factory):
+    """Test filtered listings, newest first."""
+    campaign_id = next(uuid_factory)
+    job1 = redis_tracker.create_job(task_type="test1", campaign_id=campaign_id)
+    job2 = redis_tracker.create_job(task_type="test2", campaign_id=campaign_id)
+    job3 = redis_tracker.create_job(task_type="test3", campaign_id=next(uuid_factory))
+    redis_tracker.update_status(job1.job_id, JobStatus.COMPLETED)
+
+    all_jobs = redis_tracker.list_jobs()
+    assert {j.job_id for j in all_jobs} == {job1.job_id, job2.job_id, job3.job_id}
+    created = [j.created_at for j in all_jobs]
+    assert created == sorted(created, reverse=True)
+
+    assert {j.job_id for j in redis_tracker.list_jobs(campaign_id=campaign_id)} == {job1.job_id, job2.job_id}
+    assert [j.job_id for j in redis_tracker.list_jobs(status=JobStatus.COMPLETED)] == [job1.job_id]
+    assert redis_tracker.list_jobs(campaign_id=campaign_id, status=JobStatus.RUNNING) == []
+
+
+def test_redis_delete_job(redis_tracker, uuid_factory):
+    """Test deleting a job removes it from every index."""
+    campaign_id = next(uuid_factory)
+    job = redis_tracker.create_job(task_type="test", campaign_id=campaign_id)
+    redis_tracker.update_status(job.job_id, JobStatus.COMPLETED)
+
+    assert redis_tracker.delete_job(job.job_id) is True
+    assert redis_tracker.delete_job(job.job_id) is False
+
+    assert redis_tracker.get_job(job.job_id) is None
+    assert redis_tracker.list_jobs() == []
+    assert _status_sets(redis_tracker, job.job_id) == set()
+    assert not redis_tracker._redis.exists(redis_tracker._campaign_key(campaign_id))
+    assert redis_tracker._redis.zcard(redis_tracker._completed_key) == 0
+
+
+def test_redis_cleanup_old_jobs(redis_tracker):
+    """Test that only finished jobs past the cutoff are removed."""
+    finished = redis_tracker.create_job(task_type="test")
+    running = redis_tracker.create_job(task_type="test")
+    redis_tracker.update_status(finished.job_id, JobStatus.COMPLETED)
+    redis_tracker.update_status(running.job_id, JobStatus.RUNNING)
+
+    assert redis_tracker.cleanup_old_jobs(max_age_hours=24) == 0
+    assert redis_tracker.cleanup_old_jobs(max_age_hours=-1) == 1
+
+    assert redis_tracker.get_job(finished.job_id) is None
+    assert redis_tracker.get_job(running.job_id) is not None
+    assert _status_sets(redis_tracker, finished.job_id) == set()
+    assert redis_tracker._redis.zcard(redis_tracker._completed_key) == 0
+
+
+def _interleave(monkeypatch, action):
+    """Run action once between an update's WATCHed read and its EXEC."""
+    apply_status = job_tracker_module._apply_status
+    pending = [action]
+
+    def racing_apply_status(*args):
+        if pending:
+            pending.pop()()
+        apply_status(*args)
+
+    monkeypatch.setattr(job_tracker_module, "_apply_status", racing_apply_status)
+
+
+def test_redis_update_racing_delete(redis_tracker, redis_server, monkeypatch):
+    """Test an update that loses to a concurrent delete does not recreate the job."""
+    job = redis_tracker.create_job(task_type="test")
+    other = _redis_tracker(redis_server)
+    _interleave(monkeypatch, lambda: other.delete_job(job.job_id))
+
+    assert redis_tracker.update_status(job.job_id, JobStatus.RUNNING) is None
+
+    assert not redis_tracker._redis.exists(redis_tracker._job_key(job.job_id))
+    assert _status_sets(redis_tracker, job.job_id) == set()
+
+
+def test_redis_concurrent_status_updates(redis_tracker, redis_server, monkeypatch):
+    """Test racing updates leave the job in exactly one status set."""
+    job = redis_tracker.create_job(task_type="test")
+    other = _redis_tracker(redis_server)
+    _interleave(
+        monkeypatch,
+        lambda: other.update_status(job.job_id, JobStatus.RUNNING, result={"from": "other"}),
+    )
+
+    updated = redis_tracker.update_status(job.job_id, JobStatus.FAILED, error="boom")
+
+    # The retry starts from the other writer's state instead of overwriting it
+    retrieved = redis_tracker.get_job(job.job_id)
+    assert updated.status == retrieved.status == JobStatus.FAILED
+    assert retrieved.result == {"from": "other"}
+    assert retrieved.started_ts is not None
+    assert _status_sets(redis_tracker, job.job_id) == {JobStatus.FAILED}
+
+
+def test_create_job_tracker_store_switch(monkeypatch):
+    """Test EVO_AI_JOB_STORE selects the tracker backend."""
+    monkeypatch.setattr(
+        job_tracker_module.redis.Redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(**kwargs),
+    )
+
+    monkeypatch.delenv("EVO_AI_JOB_STORE", raising=False)
+    assert type(create_job_tracker()) is JobTracker
+
+    monkeypatch.setenv("EVO_AI_JOB_STORE", " Redis ")
+    assert isinstance(create_job_tracker(), RedisJobTracker)
+
+    monkeypatch.setenv("EVO_AI_JOB_STORE", "memory")
+    assert type(create_job_tracker()) is JobTracker
@@ -10,9 +10,16 @@ This demonstrates Evo-AI's actual capabilities:
 
 import asyncio
 import httpx
-import json
+import orjson
 from datetime import datetime
 
+# Use libuv's event loop when available (Linux/macOS); falls back to asyncio's default
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 API_URL = "http://localhost:8002"
 
 
@@ -53,8 +60,12 @@ async def run_sorting_evolution():
             }
         }
 
-        response = await client.post(f"{API_URL}/api/campaigns", json=campaign_data)
-        campaign = response.json()
+        response = await client.post(
+            f"{API_URL}/api/campaigns",
+            content=orjson.dumps(campaign_data),
+            headers={"Content-Type": "application/json"},
+        )
+        campaign = orjson.loads(response.content)
         campaign_id = campaign["id"]
 
         print(f"✓ Campaign created: {campaign['name']}")
@@ -65,7 +76,7 @@ async def run_sorting_evolution():
         # Step 2: Start Campaign
         print("Step 2: Starting Campaign...")
         response = await client.post(f"{API_URL}/api/campaigns/{campaign_id}/start")
-        campaign = response.json()
+        campaign = orjson.loads(response.content)
 
         print(f"✓ Campaign started")
         print(f"  Status: {campaign['status']}")
@@ -82,7 +93,7 @@ async def run_sorting_evolution():
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
 
                 print(f"✓ Round {round_num} completed!")
                 print(f"  Variants Generated: {result.get('variants_generated', 'N/A')}")
@@ -96,7 +107,7 @@ async def run_sorting_evolution():
                 )
 
                 if variants_response.status_code == 200:
-                    variants = variants_response.json()
+                    variants = orjson.loads(variants_response.content)
 
                     print(f"\n  Top 3 Variants:")
                     for i, variant in enumerate(variants[:3], 1):
@@ -132,10 +143,14 @@ async def run_sorting_evolution():
         print("=" * 80)
         print()
 
-        # Get campaign stats
-        stats_response = await client.get(f"{API_URL}/api/campaigns/{campaign_id}/stats")
+        # Stats and reports are independent; fetch them concurrently
+        stats_response, reports_response = await asyncio.gather(
+            client.get(f"{API_URL}/api/campaigns/{campaign_id}/stats"),
+            client.get(f"{API_URL}/api/reports", params={"campaign_id": campaign_id}),
+        )
+
         if stats_response.status_code == 200:
-            stats = stats_response.json()
+            stats = orjson.loads(stats_response.content)
 
             print("Campaign Statistics:")
             print(f"  Total Rounds: {stats.get('total_rounds', 0)}")
@@ -146,14 +161,8 @@ async def run_sorting_evolution():
             print(f"  Selection Rate: {stats.get('selection_rate', 0):.1%}")
             print()
 
-        # Get reports
-        reports_response = await client.get(
-            f"{API_URL}/api/reports",
-            params={"campaign_id": campaign_id}
-        )
-
         if reports_response.status_code == 200:
-            reports_data = reports_response.json()
+            reports_data = orjson.loads(reports_response.content)
             reports = reports_data.get("reports", [])
 
             if reports:
@@ -12,8 +12,12 @@ Your first viral demo. This script:
 Run this. Screenshot it. Tweet it. Go viral.
 """
 
-import time
+import array
+import os
+import timeit
 import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, Tuple
 import sys
 import io
@@ -22,6 +26,18 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# NumPy is optional; the vectorized variant is skipped without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional too; the JIT-compiled variant needs both
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # ============================================================================
 # SOLUTION VARIANTS (The AI would generate these)
@@ -29,9 +45,11 @@ if sys.platform == 'win32':
 
 def two_sum_v1_brute_force(nums: List[int], target: int) -> List[int]:
     """V1: Brute Force - O(n²)"""
-    for i in range(len(nums)):
-        for j in range(i + 1, len(nums)):
-            if nums[i] + nums[j] == target:
+    n = len(nums)
+    for i in range(n):
+        num_i = nums[i]
+        for j in range(i + 1, n):
+            if num_i + nums[j] == target:
                 return [i, j]
     return []
 
@@ -111,13 +129,13 @@ def two_sum_v7_dict_get(nums: List[int], target: int) -> List[int]:
 
 def two_sum_v8_list_comp(nums: List[int], target: int) -> List[int]:
     """V8: List Comprehension Hybrid"""
-    for i in range(len(nums)):
-        remainder = target - nums[i]
-        try:
-            j = nums.index(remainder, i + 1)
+    # One pass records each value's last position; a partner at a later
+    # index exists iff the complement's last position is past i
+    last = {num: j for j, num in enumerate(nums)}
+    for i, num in enumerate(nums):
+        j = last.get(target - num, -1)
+        if j > i:
             return [i, j]
-        except ValueError:
-            continue
     return []
 
 
@@ -125,10 +143,11 @@ def two_sum_v9_cache_complement(nums: List[int], target: int) -> List[int]:
     """V9: Cached Complement Calculation"""
     seen = {}
     for i in range(len(nums)):
-        comp = target - nums[i]  # Cache complement
+        num = nums[i]
+        comp = target - num  # Cache complement
         if comp in seen:
             return [seen[comp], i]
-        seen[nums[i]] = i
+        seen[num] = i
     return []
 
 
@@ -137,13 +156,20 @@ def two_sum_v10_early_exit(nums: List[int], target: int) -> List[int]:
     if len(nums) < 2:
         return []
 
-    seen = {}
-    min_val, max_val = min(nums), max(nums)
+    # Min and max in one pass over the input
+    min_val = max_val = nums[0]
+    for num in nums:
+        if num < min_val:
+            min_val = num
+        elif num > max_val:
+            max_val = num
 
-    # Early exit if impossible
-    if min_val + max_val < target and min_val * 2 >= target:
+    # Early exit if impossible: every pair sum lies in [2*min, 2*max]
+    if min_val * 2 > target or max_val * 2 < target:
         return []
 
+    seen = {}
+
     for i, num in enumerate(nums):
         complement = target - num
         if complement in seen:
@@ -152,36 +178,79 @@ def two_sum_v10_early_exit(nums: List[int], target: int) -> List[int]:
     return []
 
 
+def two_sum_v11_numpy(nums: List[int], target: int) -> List[int]:
+    """V11: NumPy Sorted Search - O(n log n), vectorized"""
+    arr = np.asarray(nums, dtype=np.int64)
+    comp = target - arr
+    sorted_idx = np.argsort(arr, kind="stable")
+    sa = arr[sorted_idx]
+    left = np.searchsorted(sa, comp, side="left")
+    right = np.searchsorted(sa, comp, side="right")
+
+    # A match must be some other index (x + x == target needs two copies of x)
+    valid = (right - left) > (arr == comp)
+    i = int(np.argmax(valid))
+    if not valid[i]:
+        return []
+    for j in sorted_idx[left[i]:right[i]]:
+        if j != i:
+            return sorted([i, int(j)])
+    return []
+
+
+if njit is not None and np is not None:
+    @njit(cache=True, boundscheck=False)
+    def _two_sum_brute_force_jit(arr, target, block=256):
+        # Tiled so each block of j values (2KB of int64) stays in L1
+        # while every i of the matching block is compared against it
+        n = arr.shape[0]
+        for ii in range(0, n, block):
+            i_end = min(ii + block, n)
+            for jj in range(ii, n, block):
+                j_end = min(jj + block, n)
+                for i in range(ii, i_end):
+                    for j in range(max(jj, i + 1), j_end):
+                        if arr[i] + arr[j] == target:
+                            return i, j
+        return -1, -1
+
+    def two_sum_v12_numba(nums: List[int], target: int) -> List[int]:
+        """V12: Numba JIT Brute Force - O(n²), native cache-tiled loop"""
+        i, j = _two_sum_brute_force_jit(np.asarray(nums, dtype=np.int64), target)
+        return [i, j] if i >= 0 else []
+else:
+    two_sum_v12_numba = None
+
+
 # ============================================================================
 # BENCHMARK SYSTEM
 # ============================================================================
 
-def benchmark_solution(func, test_cases, iterations=1000):
+def verify(func, test_cases):
+    """Check a solution against every test case (also serves as warmup)"""
+    return all(sorted(func(nums, target)) == sorted(expected) for nums, target, expected in test_cases)
+
+
+def benchmark_solution(func, test_cases, iterations=1000, repeat=7):
     """Benchmark a solution function"""
     total_time = 0
     total_memory = 0
-    correct = True
 
-    for nums, target, expected in test_cases:
-        # Warmup
-        func(nums, target)
+    # Correctness is checked once up front; the loop below only measures
+    correct = verify(func, test_cases)
 
-        # Benchmark
+    for nums, target, _ in test_cases:
+        # Memory: one traced call, kept out of the timed loop
         tracemalloc.start()
-        start = time.perf_counter()
-
-        for _ in range(iterations):
-            result = func(nums, target)
-
-        end = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
+        func(nums, target)
+        _, peak = tracemalloc.get_traced_memory()
         tracemalloc.stop()
 
-        # Verify correctness
-        if sorted(result) != sorted(expected):
-            correct = False
+        # Time: best of several untraced runs, robust to GC/scheduler noise
+        timer = timeit.Timer("f(n, tg)", globals={"f": func, "n": nums, "tg": target})
+        best = min(timer.repeat(repeat=repeat, number=iterations))
 
-        total_time += (end - start) / iterations
+        total_time += best / iterations
         total_memory += peak
 
     avg_time_ms = (total_time / len(test_cases)) * 1000
@@ -194,6 +263,12 @@ def benchmark_solution(func, test_cases, iterations=1000):
     }
 
 
+def _bench_one(solution, test_cases):
+    """Benchmark one (name, func) pair; runs in a worker process"""
+    name, func = solution
+    return name, benchmark_solution(func, test_cases)
+
+
 # ============================================================================
 # MAIN DEMO
 # ============================================================================
@@ -227,22 +302,53 @@ def main():
         ("V9: Cached Complement", two_sum_v9_cache_complement),
         ("V10: Early Exit", two_sum_v10_early_exit),
     ]
+    if np is not None:
+        solutions.append(("V11: NumPy Vectorized", two_sum_v11_numpy))
+    if two_sum_v12_numba is not None:
+        # Compile once up front; benchmark workers then load the on-disk cache
+        two_sum_v12_numba([1, 2], 3)
+        solutions.append(("V12: Numba JIT", two_sum_v12_numba))
 
     print(f"🌱 Generated {len(solutions)} solution variants")
     print()
     print("⚡ Benchmarking all solutions...")
     print("-" * 80)
 
+    # Variants are independent and CPU-bound: one process per variant, up to core count
     results = []
-    for name, func in solutions:
-        bench = benchmark_solution(func, test_cases)
-        results.append((name, bench))
+    workers = min(len(solutions), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name, bench in executor.map(_bench_one, solutions, repeat(test_cases)):
+            results.append((name, bench))
 
-        status = "✅" if bench["correct"] else "❌"
-        print(f"{status} {name:25s} | {bench['avg_time_ms']:.6f}ms | {bench['avg_memory_mb']:.4f}MB")
+            status = "✅" if bench["correct"] else "❌"
+            print(f"{status} {name:25s} | {bench['avg_time_ms']:.6f}ms | {bench['avg_memory_mb']:.4f}MB")
 
     print()
 
+    # At n=4 every variant is call-overhead bound; a large input shows
+    # where vectorization and JIT pay off (interpreted O(n²) variants are left out)
+    if np is not None:
+        n = 10_000
+        nums = list(range(n))
+        list_cases = [(nums, 2 * n - 3, [n - 2, n - 1])]
+        # Compiled variants take an int64 buffer (zero-copy np.asarray);
+        # interpreted ones keep the list, since array.array re-boxes every read
+        buffer_cases = [(array.array('q', nums), 2 * n - 3, [n - 2, n - 1])]
+        print(f"📏 Scaling check (n={n:,})")
+        print("-" * 80)
+        scaling = [
+            ("V2: Hash Map O(n)", two_sum_v2_hash_map, list_cases),
+            ("V11: NumPy Vectorized", two_sum_v11_numpy, buffer_cases),
+        ]
+        if two_sum_v12_numba is not None:
+            scaling.append(("V12: Numba JIT O(n²)", two_sum_v12_numba, buffer_cases))
+        for name, func, cases in scaling:
+            bench = benchmark_solution(func, cases, iterations=10, repeat=3)
+            status = "✅" if bench["correct"] else "❌"
+            print(f"{status} {name:25s} | {bench['avg_time_ms']:.6f}ms | {bench['avg_memory_mb']:.4f}MB")
+        print()
+
     # Sort by speed
     correct_results = [(name, bench) for name, bench in results if bench["correct"]]
     correct_results.sort(key=lambda x: x[1]["avg_time_ms"])
@@ -293,16 +399,20 @@ This is problem #1 of 3,000.
     """.strip())
     print()
 
-    print("=" * 80)
-    print("📈 LEADERBOARD (Top 5)")
-    print("=" * 80)
-    print()
-    print("| Rank | Solution              | Runtime      | Memory   |")
-    print("|------|-----------------------|--------------|----------|")
+    # Build the table and write it once (one console write instead of one per row)
+    lines = [
+        "=" * 80,
+        "📈 LEADERBOARD (Top 5)",
+        "=" * 80,
+        "",
+        "| Rank | Solution              | Runtime      | Memory   |",
+        "|------|-----------------------|--------------|----------|",
+    ]
     for i, (name, bench) in enumerate(correct_results[:5], 1):
         medal = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"][i-1]
-        print(f"| {medal}    | {name:20s} | {bench['avg_time_ms']:.6f}ms | {bench['avg_memory_mb']:.4f}MB |")
-    print()
+        lines.append(f"| {medal}    | {name:20s} | {bench['avg_time_ms']:.6f}ms | {bench['avg_memory_mb']:.4f}MB |")
+    lines.append("")
+    print("\n".join(lines))
 
     print("=" * 80)
     print("✅ DEMO COMPLETE!")
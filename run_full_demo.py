@@ -2,6 +2,7 @@
 Start backend with env vars and run evolution demo
 """
 import subprocess
+import socket
 import time
 import os
 import requests
@@ -45,17 +46,24 @@ backend_process = subprocess.Popen(
 )
 
 print("Waiting for backend to be ready...")
-for i in range(30):
+# Probe the port every 100ms (cheap) and only hit /health once it accepts connections
+for i in range(300):
+    if backend_process.poll() is not None:
+        print(f"[ERROR] Backend exited with code {backend_process.returncode}")
+        sys.exit(1)
     try:
-        response = requests.get("http://localhost:8002/health", timeout=1)
+        with socket.create_connection(("127.0.0.1", 8002), timeout=0.05):
+            pass
+        response = requests.get("http://localhost:8002/health", timeout=0.5)
         if response.status_code == 200:
             print("[OK] Backend is ready!")
             print()
             break
-    except:
+    except (OSError, requests.RequestException):
         pass
-    time.sleep(1)
-    print(f"  Waiting... {i+1}/30")
+    time.sleep(0.1)
+    if (i + 1) % 10 == 0:
+        print(f"  Waiting... {(i + 1) // 10}/30")
 else:
     print("[ERROR] Backend didn't start in 30 seconds")
     backend_process.kill()
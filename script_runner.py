@@ -0,0 +1,21 @@
+"""Shared entry point for the async platform scripts."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run main to completion on uvloop when it is installed (Linux/macOS),
+    otherwise on asyncio's default loop.
+
+    Call it only under __main__, so pytest collecting a script keeps its
+    own loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
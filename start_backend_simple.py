@@ -3,18 +3,16 @@ import subprocess
 import os
 import sys
 
+from dotenv import dotenv_values
+
 # Set environment variables
 env = os.environ.copy()
 
 # Load from .env file
 env_file = r"C:\Users\adminidiakhoa\Demo\Evo_AI\backend\.env"
-with open(env_file) as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            env[key.strip()] = value.strip()
-            print(f"Set {key.strip()}")
+loaded = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+env.update(loaded)
+print("\n".join(f"Set {key}" for key in loaded))
 
 print("\n" + "="*80)
 print("  STARTING EVO-AI BACKEND")
@@ -1,70 +1,267 @@
-"""Test campaign execution - no emojis for Windows console."""
+"""
+Test campaign execution against the deployed backend.
+
+Plain ASCII output by default (safe for the Windows console); pass
+--verbose for the emoji output with pretty-printed event payloads.
+
+Usage:
+    python test_campaign.py [--verbose] [<campaign_id> ...]
+    python test_campaign.py --campaign-id <campaign_id> [--campaign-id ...]
+
+Example:
+    python test_campaign.py --verbose 2a44ae66-8df8-4c01-8fe9-6b3fe77eb369
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import queue
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 import httpx
+import orjson
 import sys
-import json
+
+import script_runner
 
 BACKEND_URL = "https://evo-ai-nakk.onrender.com"
 CAMPAIGN_ID = "2a44ae66-8df8-4c01-8fe9-6b3fe77eb369"  # LeetCode Two Sum Evolution
+FRONTEND_URL = "https://evo-ai-oluwafemi-scufield-oluwafemi-s-projects.vercel.app"
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Campaigns run at most this many at a time over the shared client
+MAX_CONCURRENT_CAMPAIGNS = 10
+
+# Endpoint paths, relative to the client's base_url
+_START = "/api/campaigns/{}/start"
+_EXEC = "/api/campaigns/{}/execute"
+_STATS = "/api/campaigns/{}/stats"
+
+# SSE field prefixes, matched against raw lines
+_SSE_DATA = b"data: "
+_SSE_DATA_LEN = len(_SSE_DATA)
+_SSE_EVENT = b"event: "
+_SSE_EVENT_LEN = len(_SSE_EVENT)
+
+# Last event the execute endpoint sends on success or failure
+_SSE_TERMINAL_EVENTS = frozenset({"campaign_completed", "error"})
 
+_client: Optional[httpx.AsyncClient] = None
+_campaign_slots = asyncio.Semaphore(MAX_CONCURRENT_CAMPAIGNS)
 
-async def start_campaign(campaign_id: str):
-    """Start a campaign."""
-    print(f"\n[1/3] Starting campaign {campaign_id}...")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BACKEND_URL}/api/campaigns/{campaign_id}/start",
-            timeout=30.0
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared pooled client, creating it on first use.
+
+    The host is resolved only when the pool opens a connection; kept-alive
+    connections are reused across campaigns, so DNS and TLS are paid once
+    per connection rather than once per request or per client.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            http2=HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
         )
+    return _client
+
+
+async def start_campaign(client: httpx.AsyncClient, campaign_id: str, verbose: bool = False):
+    """Start a campaign (change status to ACTIVE)."""
+    if verbose:
+        print(f">> Starting campaign {campaign_id}...")
+    else:
+        print(f"\n[1/3] Starting campaign {campaign_id}...")
 
-        if response.status_code == 200:
-            data = response.json()
+    response = await client.post(_START.format(campaign_id))
+
+    if response.status_code == 200:
+        data = orjson.loads(response.content)
+        if verbose:
+            print(f"✅ Campaign started! Status: {data['status']}")
+        else:
             print(f"SUCCESS! Campaign status: {data['status']}")
-            return data
+        return data
+    else:
+        if verbose:
+            print(f"❌ Failed to start campaign: {response.status_code}")
+            print(response.text)
         else:
             print(f"FAILED: {response.status_code} - {response.text}")
-            return None
-
-
-async def execute_campaign(campaign_id: str):
-    """Execute campaign."""
-    print(f"\n[2/3] Executing campaign (running 2 evolution rounds)...")
-    print("This will run all 5 AI agents:")
-    print("  - PlannerAgent: Creates round strategy")
-    print("  - VariantAgent: Generates code variants")
-    print("  - ScorerAgent: Evaluates variants")
-    print("  - PolicyAgent: Selects best variants")
-    print("  - ReporterAgent: Creates summary\n")
-
-    async with httpx.AsyncClient() as client:
-        async with client.stream(
-            "POST",
-            f"{BACKEND_URL}/api/campaigns/{campaign_id}/execute",
-            params={"max_rounds": 2},
-            timeout=300.0
-        ) as response:
+        return None
+
+
+@contextmanager
+def queued_logger(name: str):
+    """
+    Yield a logger whose records are written to stdout by a background thread.
+
+    The caller only pays for putting a record on a queue; the listener is
+    stopped (and the queue drained) on exit, so later prints stay in order.
+    """
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(records, console)
+
+    log = logging.getLogger(name)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    handler = QueueHandler(records)
+    log.addHandler(handler)
+
+    listener.start()
+    try:
+        yield log
+    finally:
+        log.removeHandler(handler)
+        listener.stop()
+
+
+async def iter_sse_frames(response: httpx.Response):
+    """
+    Yield (event, data) for each server-sent event frame.
+
+    Scans the byte stream (raw unless the server applied a content
+    encoding) for newlines and matches field prefixes on bytes; only the
+    event name is decoded here, data stays as bytes.
+    """
+    buf = bytearray()
+    event = None
+    data = []
+
+    def feed(line):
+        nonlocal event, data
+        line = line.rstrip(b"\r")
+        if not line:
+            frame = (event, b"\n".join(data)) if event is not None or data else None
+            event, data = None, []
+            return frame
+        if line.startswith(_SSE_DATA):
+            data.append(bytes(line[_SSE_DATA_LEN:]))
+        elif line.startswith(_SSE_EVENT):
+            event = line[_SSE_EVENT_LEN:].decode("utf-8")
+        return None
+
+    # The request asks for identity encoding, so raw bytes are normally the
+    # text; a server that compresses anyway gets decoded. Lines are located
+    # with bytearray.find (memchr) and the consumed prefix is dropped once
+    # per chunk rather than once per line.
+    encoding = response.headers.get("content-encoding", "identity").strip().lower()
+    chunks = response.aiter_raw() if encoding == "identity" else response.aiter_bytes()
+    async for chunk in chunks:
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            frame = feed(buf[start:end])
+            start = end + 1
+            if frame is not None:
+                yield frame
+        del buf[:start]
+
+    # Stream ended without a trailing blank line
+    for line in (buf, b""):
+        frame = feed(line)
+        if frame is not None:
+            yield frame
+
+
+async def execute_campaign(
+    client: httpx.AsyncClient, campaign_id: str, max_rounds: int = 2, verbose: bool = False
+):
+    """
+    Execute a campaign and stream results.
+
+    This triggers the full AI agent pipeline:
+    1. PlannerAgent - Plans the round strategy
+    2. VariantAgent - Generates code variants
+    3. ScorerAgent - Evaluates each variant
+    4. PolicyAgent - Selects best variants
+    5. ReporterAgent - Creates summary
+    """
+    if verbose:
+        print(f"\n🎯 Executing campaign with {max_rounds} rounds...")
+        print("This will:")
+        print("  1. Run PlannerAgent to create strategy")
+        print("  2. Generate code variants with VariantAgent")
+        print("  3. Score variants with ScorerAgent")
+        print("  4. Select best with PolicyAgent")
+        print("  5. Create reports with ReporterAgent\n")
+    else:
+        print(f"\n[2/3] Executing campaign (running {max_rounds} evolution rounds)...")
+        print("This will run all 5 AI agents:")
+        print("  - PlannerAgent: Creates round strategy")
+        print("  - VariantAgent: Generates code variants")
+        print("  - ScorerAgent: Evaluates variants")
+        print("  - PolicyAgent: Selects best variants")
+        print("  - ReporterAgent: Creates summary\n")
+
+    async with client.stream(
+        "POST",
+        _EXEC.format(campaign_id),
+        params={"max_rounds": max_rounds},
+        # SSE frames are small and already streamed; skip gzip/br inflate per chunk
+        headers={"Accept-Encoding": "identity"},
+        timeout=300.0  # 5 minutes
+    ) as response:
+        if verbose:
+            print(f"📡 Streaming execution (status {response.status_code})...\n")
+        else:
             print(f"Streaming execution (HTTP {response.status_code})...\n")
 
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    print(f"  {line[6:]}")
-                elif line.startswith("event: "):
-                    print(f"\n[EVENT] {line[7:]}")
+        with queued_logger(f"sse.{campaign_id}") as log:
+            async for event, data in iter_sse_frames(response):
+                if not verbose:
+                    if event is not None:
+                        log.info(f"\n[EVENT] {event}")
+                    if data:
+                        log.info(f"  {data.decode('utf-8')}")
+                else:
+                    if event is not None:
+                        log.info(f"\n🎬 Event: {event}")
+                    if data:
+                        try:
+                            event_data = orjson.loads(data)
+                            log.info(f"📊 {orjson.dumps(event_data, option=orjson.OPT_INDENT_2).decode()}")
+                        except orjson.JSONDecodeError:
+                            log.info(f"📝 {data.decode('utf-8')}")
 
+                # Nothing useful follows these. Leaving before EOF closes the
+                # connection on HTTP/1.1 (only the stream on HTTP/2), so the
+                # stats request may open a new one; waiting for EOF instead
+                # would hang if the server keeps the stream open.
+                if event in _SSE_TERMINAL_EVENTS:
+                    break
 
-async def get_stats(campaign_id: str):
-    """Get final stats."""
-    print(f"\n[3/3] Getting campaign statistics...")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BACKEND_URL}/api/campaigns/{campaign_id}/stats",
-            timeout=30.0
-        )
+async def get_stats(client: httpx.AsyncClient, campaign_id: str, verbose: bool = False):
+    """Get campaign statistics after execution."""
+    if verbose:
+        print(f"\n📈 Getting campaign stats...")
+    else:
+        print(f"\n[3/3] Getting campaign statistics...")
+
+    response = await client.get(_STATS.format(campaign_id))
 
-        if response.status_code == 200:
-            stats = response.json()
+    if response.status_code == 200:
+        stats = orjson.loads(response.content)
+        if verbose:
+            print("\n✨ Campaign Statistics:")
+            print(f"  Total Rounds: {stats['total_rounds']}")
+            print(f"  Completed Rounds: {stats['completed_rounds']}")
+            print(f"  Total Variants: {stats['total_variants']}")
+            print(f"  Selected Variants: {stats['total_selected']}")
+            print(f"  Max Generation: {stats['max_generation']}")
+            print(f"  Selection Rate: {stats['selection_rate']:.2%}")
+        else:
             print("\n" + "="*50)
             print("CAMPAIGN RESULTS:")
             print("="*50)
@@ -75,28 +272,70 @@ async def get_stats(campaign_id: str):
             print(f"Max Generation: {stats['max_generation']}")
             print(f"Selection Rate: {stats['selection_rate']:.1%}")
             print("="*50)
+        return stats
+    else:
+        if verbose:
+            print(f"❌ Failed to get stats: {response.status_code}")
         else:
             print(f"FAILED: {response.status_code}")
+        return None
+
+
+async def run_one(campaign_id: str, verbose: bool = False):
+    """Start, execute and report on one campaign."""
+    async with _campaign_slots:
+        client = get_client()
+        campaign = await start_campaign(client, campaign_id, verbose)
+        if campaign:
+            await execute_campaign(client, campaign_id, max_rounds=2, verbose=verbose)
+            await get_stats(client, campaign_id, verbose)
+
+    if verbose:
+        print(f"\n🌐 View results at:")
+        print(f"   Frontend: {FRONTEND_URL}/campaigns/{campaign_id}")
+    else:
+        print(f"\nView results: {FRONTEND_URL}/campaigns/{campaign_id}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Start, execute and report on Evo-AI campaigns.")
+    parser.add_argument("campaign_ids", nargs="*", metavar="campaign_id", help="campaign(s) to run")
+    parser.add_argument(
+        "--campaign-id", action="append", default=[], dest="extra_ids", metavar="ID",
+        help="campaign to run (may be repeated)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="emoji output with pretty-printed event payloads",
+    )
+    args = parser.parse_args(argv)
+    args.campaign_ids = args.campaign_ids + args.extra_ids or [CAMPAIGN_ID]
+    return args
 
 
-async def main():
-    campaign_id = sys.argv[1] if len(sys.argv) > 1 else CAMPAIGN_ID
+async def main(argv=None):
+    args = parse_args(argv)
+    campaign_ids = args.campaign_ids
+    width = 60 if args.verbose else 50
 
-    print("="*50)
-    print("EVO-AI PLATFORM TEST")
-    print("="*50)
-    print(f"Campaign: {campaign_id}")
+    print("="*width)
+    print("🤖 EVO-AI PLATFORM TEST" if args.verbose else "EVO-AI PLATFORM TEST")
+    print("="*width)
+    print(f"Campaign(s): {', '.join(campaign_ids)}")
     print(f"Backend: {BACKEND_URL}")
 
-    # Execute full flow
-    campaign = await start_campaign(campaign_id)
-    if campaign:
-        await execute_campaign(campaign_id)
-        await get_stats(campaign_id)
+    # Each campaign runs its steps in order; separate campaigns overlap
+    try:
+        await asyncio.gather(*(run_one(cid, args.verbose) for cid in campaign_ids))
+    finally:
+        await get_client().aclose()
 
-    print(f"\nView results: https://evo-ai-oluwafemi-scufield-oluwafemi-s-projects.vercel.app/campaigns/{campaign_id}")
+    if args.verbose:
+        print("\n" + "="*60)
+        print("✅ Test Complete!")
+        print("="*60)
+        print(f"   API Docs: {BACKEND_URL}/docs")
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    script_runner.run(main())
@@ -8,40 +8,60 @@ This script:
 4. Lists all campaigns
 """
 
-import requests
-import json
+import asyncio
+import importlib.util
+
+import httpx
+import orjson
 from datetime import datetime
 
+import script_runner
+
 # Your live backend URL
 API_URL = "https://evo-ai-nakk.onrender.com"
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+def make_client():
+    """Create one client; with HTTP/2 all probes multiplex over a single connection."""
+    return httpx.AsyncClient(
+        base_url=API_URL,
+        timeout=30.0,
+        transport=httpx.AsyncHTTPTransport(http2=HTTP2, retries=3),
+    )
+
 def print_section(title):
     """Print a formatted section header."""
     print("\n" + "="*60)
     print(f"  {title}")
     print("="*60)
 
-def test_health():
+async def test_health(client):
     """Test the health endpoint."""
     print_section("1. Testing Health Endpoint")
 
-    response = requests.get(f"{API_URL}/health")
+    response = await client.get("/health")
 
     if response.status_code == 200:
-        data = response.json()
-        print("[OK] Backend is healthy!")
-        print(f"   Version: {data['version']}")
-        print(f"   Status: {data['status']}")
-        print("\n   Services:")
-        for service, status in data['services'].items():
-            indicator = "[OK]" if status == "up" else "[WARN]"
-            print(f"   {indicator} {service}: {status}")
+        data = orjson.loads(response.content)
+        lines = [
+            "[OK] Backend is healthy!",
+            f"   Version: {data['version']}",
+            f"   Status: {data['status']}",
+            "\n   Services:",
+        ]
+        lines += [
+            f"   {'[OK]' if status == 'up' else '[WARN]'} {service}: {status}"
+            for service, status in data['services'].items()
+        ]
+        print("\n".join(lines))
         return True
     else:
         print(f"[ERROR] Health check failed: {response.status_code}")
         return False
 
-def create_campaign():
+async def create_campaign(client):
     """Create a test campaign."""
     print_section("2. Creating Test Campaign")
 
@@ -60,14 +80,14 @@ def create_campaign():
     print("Sending request to create campaign...")
     print(f"Campaign name: {campaign_data['name']}")
 
-    response = requests.post(
-        f"{API_URL}/api/campaigns",
-        json=campaign_data,
-        headers={"Content-Type": "application/json"}
+    response = await client.post(
+        "/api/campaigns",
+        content=orjson.dumps(campaign_data),
+        headers={"Content-Type": "application/json"},
     )
 
     if response.status_code == 201:
-        data = response.json()
+        data = orjson.loads(response.content)
         print("[OK] Campaign created successfully!")
         print(f"\n   Campaign ID: {data['id']}")
         print(f"   Name: {data['name']}")
@@ -79,98 +99,105 @@ def create_campaign():
         print(f"   Error: {response.text}")
         return None
 
-def get_campaign(campaign_id):
+async def get_campaign(client, campaign_id):
     """Get campaign details."""
-    print_section("3. Retrieving Campaign Details")
+    response = await client.get(f"/api/campaigns/{campaign_id}")
 
-    response = requests.get(f"{API_URL}/api/campaigns/{campaign_id}")
+    # Printed after the request completes so concurrent probes do not interleave
+    print_section("3. Retrieving Campaign Details")
 
     if response.status_code == 200:
-        data = response.json()
-        print("[OK] Campaign retrieved successfully!")
-        print(f"\n   ID: {data['id']}")
-        print(f"   Name: {data['name']}")
-        print(f"   Description: {data['description']}")
-        print(f"   Status: {data['status']}")
-        print(f"\n   Configuration:")
-        for key, value in data['config'].items():
-            print(f"   - {key}: {value}")
+        data = orjson.loads(response.content)
+        lines = [
+            "[OK] Campaign retrieved successfully!",
+            f"\n   ID: {data['id']}",
+            f"   Name: {data['name']}",
+            f"   Description: {data['description']}",
+            f"   Status: {data['status']}",
+            "\n   Configuration:",
+        ]
+        lines += [f"   - {key}: {value}" for key, value in data['config'].items()]
+        print("\n".join(lines))
         return True
     else:
         print(f"[ERROR] Failed to get campaign: {response.status_code}")
         return False
 
-def list_campaigns():
+async def list_campaigns(client):
     """List all campaigns."""
-    print_section("4. Listing All Campaigns")
+    response = await client.get("/api/campaigns", params={"page": 1, "page_size": 10})
 
-    response = requests.get(f"{API_URL}/api/campaigns?page=1&page_size=10")
+    print_section("4. Listing All Campaigns")
 
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         total = data.get('total', 0)
         campaigns = data.get('campaigns', [])
 
-        print(f"[OK] Found {total} campaign(s)")
+        lines = [f"[OK] Found {total} campaign(s)"]
 
         if campaigns:
-            print("\nRecent campaigns:")
+            lines.append("\nRecent campaigns:")
             for i, campaign in enumerate(campaigns[:5], 1):
-                print(f"\n   {i}. {campaign['name']}")
-                print(f"      ID: {campaign['id']}")
-                print(f"      Status: {campaign['status']}")
-                print(f"      Created: {campaign['created_at']}")
+                lines += [
+                    f"\n   {i}. {campaign['name']}",
+                    f"      ID: {campaign['id']}",
+                    f"      Status: {campaign['status']}",
+                    f"      Created: {campaign['created_at']}",
+                ]
+        print("\n".join(lines))
         return True
     else:
         print(f"[ERROR] Failed to list campaigns: {response.status_code}")
         return False
 
-def get_campaign_stats(campaign_id):
+async def get_campaign_stats(client, campaign_id):
     """Get campaign statistics."""
-    print_section("5. Getting Campaign Statistics")
+    response = await client.get(f"/api/campaigns/{campaign_id}/stats")
 
-    response = requests.get(f"{API_URL}/api/campaigns/{campaign_id}/stats")
+    print_section("5. Getting Campaign Statistics")
 
     if response.status_code == 200:
-        data = response.json()
-        print("[OK] Campaign statistics retrieved!")
-        print(f"\n   Total Rounds: {data.get('total_rounds', 0)}")
-        print(f"   Completed Rounds: {data.get('completed_rounds', 0)}")
-        print(f"   Total Variants: {data.get('total_variants', 0)}")
-        print(f"   Selected Variants: {data.get('total_selected', 0)}")
-        print(f"   Max Generation: {data.get('max_generation', 0)}")
-        print(f"   Selection Rate: {data.get('selection_rate', 0):.2%}")
+        data = orjson.loads(response.content)
+        print("\n".join([
+            "[OK] Campaign statistics retrieved!",
+            f"\n   Total Rounds: {data.get('total_rounds', 0)}",
+            f"   Completed Rounds: {data.get('completed_rounds', 0)}",
+            f"   Total Variants: {data.get('total_variants', 0)}",
+            f"   Selected Variants: {data.get('total_selected', 0)}",
+            f"   Max Generation: {data.get('max_generation', 0)}",
+            f"   Selection Rate: {data.get('selection_rate', 0):.2%}",
+        ]))
         return True
     else:
         print(f"[WARN] Stats not available yet (campaign needs to run first)")
         return False
 
-def main():
+async def main():
     """Run all tests."""
     print("\n" + "="*60)
     print("  EVO-AI PLATFORM TEST SUITE")
     print("  Live Backend: " + API_URL)
     print("="*60)
 
-    # Test 1: Health check
-    if not test_health():
-        print("\n[ERROR] Backend is not healthy. Stopping tests.")
-        return
-
-    # Test 2: Create campaign
-    campaign_id = create_campaign()
-    if not campaign_id:
-        print("\n[ERROR] Could not create campaign. Stopping tests.")
-        return
-
-    # Test 3: Get campaign details
-    get_campaign(campaign_id)
-
-    # Test 4: List all campaigns
-    list_campaigns()
-
-    # Test 5: Get campaign stats
-    get_campaign_stats(campaign_id)
+    async with make_client() as client:
+        # Test 1: Health check
+        if not await test_health(client):
+            print("\n[ERROR] Backend is not healthy. Stopping tests.")
+            return
+
+        # Test 2: Create campaign
+        campaign_id = await create_campaign(client)
+        if not campaign_id:
+            print("\n[ERROR] Could not create campaign. Stopping tests.")
+            return
+
+        # Tests 3-5 are independent reads: details, listing and stats
+        await asyncio.gather(
+            get_campaign(client, campaign_id),
+            list_campaigns(client),
+            get_campaign_stats(client, campaign_id),
+        )
 
     # Summary
     print_section("TEST SUITE COMPLETE!")
@@ -191,7 +218,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        script_runner.run(main())
     except Exception as e:
         print(f"\n[ERROR] Error running tests: {e}")
         import traceback